@@ -1,14 +1,58 @@
-from .data import Data
-from .file import File
-from .vasp_elements import AvailableBlocksVasp
-from .gpaw_elements import AvailableBlocksGpaw
-from .orca_elements import AvailableBlocksOrca
-from .regex_request import RegexRequest
-from .regex_settings import (DEFAULT_GPAW_REGEX_FILE,
-                             DEFAULT_GPAW_REGEX_SETTINGS,
-                             DEFAULT_ORCA_REGEX_FILE,
-                             DEFAULT_ORCA_REGEX_SETTINGS,
-                             DEFAULT_VASP_REGEX_FILE,
-                             DEFAULT_VASP_REGEX_SETTINGS,
-                             RegexBlueprint,
-                             RegexSettings)
+import importlib
+
+# The public names are imported from their modules on first use, so
+# importing the package (e.g. for the command line scripts) does not load
+# pandas and the element registries before they are needed
+_LAZY_NAMES = {
+    'Data': '.data',
+    'File': '.file',
+    'AvailableBlocksVasp': '.vasp_elements',
+    'AvailableBlocksGpaw': '.gpaw_elements',
+    'AvailableBlocksOrca': '.orca_elements',
+    'RegexRequest': '.regex_request',
+    'DEFAULT_GPAW_REGEX_FILE': '.regex_settings',
+    'DEFAULT_ORCA_REGEX_FILE': '.regex_settings',
+    'DEFAULT_VASP_REGEX_FILE': '.regex_settings',
+    'RegexBlueprint': '.regex_settings',
+    'RegexSettings': '.regex_settings',
+    'get_default_regex_settings': '.regex_settings',
+    # The DEFAULT_*_REGEX_SETTINGS are loaded by regex_settings on first use
+    'DEFAULT_ORCA_REGEX_SETTINGS': '.regex_settings',
+    'DEFAULT_GPAW_REGEX_SETTINGS': '.regex_settings',
+    'DEFAULT_VASP_REGEX_SETTINGS': '.regex_settings',
+}
+
+_SUBMODULES = ('data', 'elements', 'file', 'gpaw_elements', 'logging_config',
+               'orca_elements', 'regex_request', 'regex_settings', 'scripts',
+               'units_and_constants', 'vasp_elements')
+
+# A star import gives the same names as when everything was imported eagerly,
+# including the submodules, except scripts that the package never imported
+__all__ = [*_LAZY_NAMES, *(name for name in _SUBMODULES if name != 'scripts')]
+
+
+def __getattr__(name):
+    """
+    Imports the public names and submodules of the package on first access.
+
+    `DEFAULT_ORCA_REGEX_SETTINGS`, `DEFAULT_GPAW_REGEX_SETTINGS` and `DEFAULT_VASP_REGEX_SETTINGS` are the pre-loaded `RegexSettings` instances containing the default regex patterns for ORCA, GPAW and VASP output parsing. They are taken from :mod:`chemparse.regex_settings`, which reads each one from its JSON file the first time it is used.
+
+    :param name: The name of the requested package attribute.
+    :type name: str
+    :return: The object or submodule with that name.
+    :raises AttributeError: If `name` is not a public name or submodule of the package.
+    """
+    if name in _LAZY_NAMES:
+        module = importlib.import_module(_LAZY_NAMES[name], __name__)
+        value = getattr(module, name)
+    elif name in _SUBMODULES:
+        # Submodules stay reachable as attributes, as when they were imported eagerly
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_SUBMODULES))
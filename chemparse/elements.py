@@ -1,3 +1,4 @@
+import itertools
 import re
 import warnings
 from datetime import timedelta
@@ -8,7 +9,9 @@ from typing_extensions import Self
 
 from .data import Data
 from .logging_config import logger
-from .units_and_constants import ureg
+
+_next_element_id = itertools.count().__next__
+"""Returns a new process-wide unique integer used to key extracted elements."""
 
 
 class ExtractionError(Exception):
@@ -6,12 +6,9 @@ import pandas as pd
 from typing_extensions import Iterable, Self
 
 from .data import Data
-from .elements import BlockUnknown, Element
+from .elements import BlockUnknown, Element, _next_element_id
 from .logging_config import logger
-from .regex_settings import (DEFAULT_GPAW_REGEX_SETTINGS,
-                             DEFAULT_ORCA_REGEX_SETTINGS,
-                             DEFAULT_VASP_REGEX_SETTINGS,
-                             RegexSettings)
+from .regex_settings import RegexSettings, get_default_regex_settings
 
 
 class File:
@@ -59,15 +56,8 @@ class File:
         self.mode: str = mode
 
         if regex_settings is None:
-            if mode == 'ORCA':
-                self.regex_settings: RegexSettings = DEFAULT_ORCA_REGEX_SETTINGS
-            elif mode == 'GPAW':
-                self.regex_settings: RegexSettings = DEFAULT_GPAW_REGEX_SETTINGS
-            elif mode == 'VASP':
-                self.regex_settings: RegexSettings = DEFAULT_VASP_REGEX_SETTINGS
-            else:
-                raise ValueError(
-                    f"Invalid mode '{mode}'. Must be 'ORCA', 'GPAW' or 'VASP'.")
+            self.regex_settings: RegexSettings = get_default_regex_settings(
+                mode)
         else:
             self.regex_settings: RegexSettings = regex_settings
 
@@ -76,6 +66,8 @@ class File:
         # Reading the content of the file.
         with open(file_path, "r") as file:
             self.original_text: str = file.read()
+        # Counted once here, every later line position is derived incrementally
+        self._n_lines: int = self.original_text.count('\n') + 1
 
         # Initializing the DataFrame to store elements.
         self._blocks: pd.DataFrame = pd.DataFrame(
@@ -83,7 +75,7 @@ class File:
 
         self._marked_text: list[tuple[tuple[int, int], tuple[int, int], str | Element]] = [
             ((0, len(self.original_text)),
-             (1, self.original_text.count('\n') + 1), self.original_text)
+             (1, self._n_lines), self.original_text)
         ]
 
     def get_structure(self) -> dict[Self, list]:
@@ -152,7 +144,7 @@ class File:
             columns=['Type', 'Subtype', 'Element', 'CharPosition', 'LinePosition'])
         self._marked_text: list[tuple[tuple[int, int], tuple[int, int], str | Element]] = [
             ((0, len(self.original_text)),
-             (1, self.original_text.count('\n') + 1), self.original_text)
+             (1, self._n_lines), self.original_text)
         ]
 
         # Processing each regex pattern and updating blocks and marked text
@@ -172,7 +164,7 @@ class File:
                     block, char_position=char_position, line_position=line_position)
                 self._marked_text[i] = (
                     char_position, line_position, unknown_block)
-                unknown_blocks[hash(unknown_block)] = {
+                unknown_blocks[_next_element_id()] = {
                     'Element': unknown_block, 'CharPosition': char_position, 'LinePosition': line_position}
 
         unknown_blocks_df = pd.DataFrame.from_dict(
@@ -367,45 +359,53 @@ class File:
         # Process the text to ensure all elements are captured
         processed_text = self.get_marked_text(show_progress=show_progress)
 
-        body_content = ''.join(element[2].to_html()
-                               for element in processed_text)
-
         # Construct the full HTML Document with CSS and JS if requested
-        html_content = "<!DOCTYPE html>\n"
-        html_content += "<html lang=\"en\">\n<head>\n"
-        html_content += "    <meta charset=\"UTF-8\">\n"
-        html_content += "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n"
-        html_content += f"    <title>{self.mode}</title>\n"
+        html_parts = [
+            "<!DOCTYPE html>\n",
+            "<html lang=\"en\">\n<head>\n",
+            "    <meta charset=\"UTF-8\">\n",
+            "    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n",
+            f"    <title>{self.mode}</title>\n",
+        ]
 
         if insert_css:
-            html_content += "    <style>\n        " + \
-                (css_content if css_content else "") + "\n    </style>\n"
+            html_parts += ("    <style>\n        ",
+                           css_content if css_content else "",
+                           "\n    </style>\n")
 
-        html_content += "</head>\n<body>\n"
-        html_content += "    <div class=\"container\">\n"
+        html_parts.append("</head>\n<body>\n")
+        html_parts.append("    <div class=\"container\">\n")
 
         if insert_left_sidebar:
-            html_content += "        <div class=\"sidebar\">\n"
-            html_content += "            <!-- Left sidebar content (TOC) -->\n"
-            html_content += "            <div class=\"toc\">\n    <!-- JavaScript will populate this area -->\n</div>"
-            html_content += "        </div>\n"
+            html_parts.append("        <div class=\"sidebar\">\n")
+            html_parts.append(
+                "            <!-- Left sidebar content (TOC) -->\n")
+            html_parts.append(
+                "            <div class=\"toc\">\n    <!-- JavaScript will populate this area -->\n</div>")
+            html_parts.append("        </div>\n")
 
         if insert_colorcomment_sidebar:
-            html_content += "        <div class=\"comment-sidebar\">\n"
-            html_content += "            <!-- comment sidebar for color-comment sections -->\n"
-            html_content += "            <!-- JavaScript will populate this area -->\n        </div>\n"
-
-        html_content += "        <div class=\"content\">\n            " + \
-            body_content + "\n        </div>\n"
-        html_content += "    </div>\n"
+            html_parts.append("        <div class=\"comment-sidebar\">\n")
+            html_parts.append(
+                "            <!-- comment sidebar for color-comment sections -->\n")
+            html_parts.append(
+                "            <!-- JavaScript will populate this area -->\n        </div>\n")
+
+        # The body is streamed straight into the parts list, so the (large)
+        # document is only assembled once by the final join
+        html_parts.append("        <div class=\"content\">\n            ")
+        html_parts.extend(element[2].to_html() for element in processed_text)
+        html_parts.append("\n        </div>\n")
+        html_parts.append("    </div>\n")
 
         if insert_js:
-            html_content += "    <script>\n        " + \
-                (js_content if js_content else "") + "\n    </script>\n"
+            html_parts += ("    <script>\n        ",
+                           js_content if js_content else "",
+                           "\n    </script>\n")
 
-        html_content += "</body>\n</html>"
+        html_parts.append("</body>\n</html>")
 
-        return html_content
+        return ''.join(html_parts)
 
     def save_as_html(self, output_file_path: str,
                      insert_css: Optional[bool] = True,
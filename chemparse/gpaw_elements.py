@@ -1,3 +1,4 @@
+import functools
 import re
 import warnings
 from datetime import timedelta
@@ -8,7 +9,22 @@ import pandas as pd
 
 from .data import Data
 from .elements import AvailableBlocksGeneral, Block, Element, ExtractionError
-from .units_and_constants import ureg
+from .units_and_constants import get_unit_registry
+
+
+_NUMBER_RE = re.compile(r"[-+]?\d*\.\d+|\d+")
+"""Matches the signed decimal and integer numbers of a block."""
+
+
+@functools.cache
+def _dipole_unit():
+    """
+    The unit of GPAW dipole moments, |e|*Ang, built once on first use.
+
+    :rtype: pint.Unit
+    """
+    ureg = get_unit_registry()
+    return ureg.elementary_charge * ureg.angstrom
 
 
 class AvailableBlocksGpaw(AvailableBlocksGeneral):
@@ -69,10 +85,11 @@ class BlockGpawDipole(Block):
 
         :rtype: Data
         """
-        numbers = re.findall(r"[-+]?\d*\.\d+|\d+", self.raw_data)
-        # Convert extracted numbers to a numpy array of floats
-        dipole_moment = np.array(numbers, dtype=float) * \
-            ureg.elementary_charge * ureg.angstrom
+        ureg = get_unit_registry()
+        numbers = _NUMBER_RE.findall(self.raw_data)
+        # Convert extracted numbers to a numpy array of floats and attach the unit once
+        dipole_moment = ureg.Quantity(np.array(numbers, dtype=float),
+                                      _dipole_unit())
         return Data(data={'Dipole Moment': dipole_moment},
                     comment="`Dipole Moment` numpy array in |e|*Ang, can be converted to Debye with .to('D')")
 
@@ -130,24 +147,24 @@ class BlockGpawEnergyContributions(Block):
 
         :rtype: Data
         """
-        energy_data_lines = self.raw_data.split('\n')
+        ureg = get_unit_registry()
         energy_dict = {'Contributions': {}}
 
-        # Iterating over each line to extract relevant data
-        for line in energy_data_lines:
-            if 'reference' in line:
+        # Each line is split once at its first colon and dispatched on the
+        # stripped key, lines without a colon carry no data
+        for line in self.raw_data.split('\n'):
+            key, separator, value = line.partition(':')
+            if not separator:
+                continue
+            key = key.strip()
+            if key in ('Free energy', 'Extrapolated'):
+                energy_dict[key] = float(value) * ureg.eV
+            elif 'reference' in key:
+                # The header line ends with the reference energy, "(reference = -10231.780790)"
                 energy_dict['Reference'] = float(
-                    line.split('=')[-1].strip().split(')')[0]) * ureg.eV
-            elif 'Free energy' in line:
-                energy_dict['Free energy'] = float(
-                    line.split(':')[-1].strip()) * ureg.eV
-            elif 'Extrapolated' in line:
-                energy_dict['Extrapolated'] = float(
-                    line.split(':')[-1].strip()) * ureg.eV
-            elif ':' in line:
-                key, value = line.split(':')
-                energy_dict['Contributions'][key.strip()] = float(
-                    value.strip()) * ureg.eV
+                    value.split('=')[-1].split(')')[0]) * ureg.eV
+            else:
+                energy_dict['Contributions'][key] = float(value) * ureg.eV
 
         return Data(data=energy_dict, comment="""`Reference`, `Free energy`, `Extrapolated` are pint.Quantity objects
                                                 and `Contributions` is a nested dict of pint.Quantity objects.
@@ -186,7 +203,8 @@ class BlockGpawConvergedAfter(Block):
 
         :rtype: Data
         """
-        numbers = re.findall(r'\d+', self.raw_data)
+        # The line holds a single whitespace separated count, no regex is needed
+        numbers = [token for token in self.raw_data.split() if token.isdigit()]
 
         assert len(numbers) == 1, f"Expected 1 number, got {len(numbers)}"
         iterations = int(numbers[0])
@@ -221,41 +239,54 @@ class BlockGpawOrbitalEnergies(Block):
 
         :return: :class:`chemparse.data.Data` object that contains:
 
-            - :class:`pandas.DataFrame` `UpDownOrbitals` with columns: Band, Eigenvalues_Up, Occupancy_Up, Eigenvalues_Down, Occupancy_Down. Eigenvalues are in eV.
+            - :class:`pandas.DataFrame` `UpDownOrbitals` with columns: Band (:class:`int`), Eigenvalues_Up, Occupancy_Up, Eigenvalues_Down, Occupancy_Down (:class:`float`). The columns hold plain numbers, so they stay vectorized.
+            - :class:`dict` `Units` with the :class:`pint.Unit` of the columns that have one: eV for Eigenvalues_Up and Eigenvalues_Down.
 
             Parsed data example:
 
             .. code-block:: none
 
-                {'UpDownOrbitals':      Band Eigenvalues_Up Occupancy_Up Eigenvalues_Down Occupancy_Down
-                0    Band    Eigenvalues    Occupancy      Eigenvalues      Occupancy
-                1       0      -24.42908      1.00000        -24.57211        1.00000
-                2       1      -22.16252      1.00000        -22.18228        1.00000
-                3       2      -21.55401      1.00000        -21.60131        1.00000
-                4       3      -19.15063      1.00000        -19.19201        1.00000
-                ..    ...            ...          ...              ...            ...
-                248   247       81.59782      0.00000         81.62746        0.00000
-                249   248       81.85757      0.00000         81.83158        0.00000
-                250   249       83.60243      0.00000         83.51849        0.00000
-                251   250       87.94628      0.00000         87.90765        0.00000
-                252   251       95.86929      0.00000         95.86901        0.00000
-
-                [253 rows x 5 columns]}
+                {'UpDownOrbitals':      Band  Eigenvalues_Up  Occupancy_Up  Eigenvalues_Down  Occupancy_Down
+                0       0       -24.42908           1.0         -24.57211             1.0
+                1       1       -22.16252           1.0         -22.18228             1.0
+                2       2       -21.55401           1.0         -21.60131             1.0
+                3       3       -19.15063           1.0         -19.19201             1.0
+                4       4       -19.10920           1.0         -19.10168             1.0
+                ..    ...             ...           ...               ...             ...
+                247   247        81.59782           0.0          81.62746             0.0
+                248   248        81.85757           0.0          81.83158             0.0
+                249   249        83.60243           0.0          83.51849             0.0
+                250   250        87.94628           0.0          87.90765             0.0
+                251   251        95.86929           0.0          95.86901             0.0
+
+                [252 rows x 5 columns], 'Units': {'Eigenvalues_Up': <Unit('electron_volt')>, 'Eigenvalues_Down': <Unit('electron_volt')>}}
 
         :rtype: Data
         """
-        # Using StringIO to simulate a file
-        data_io = StringIO(self.raw_data)
-
+        ureg = get_unit_registry()
         # Column names need to be adjusted due to duplicate 'Eigenvalues' and 'Occupancy'
         column_names = ['Band', 'Eigenvalues_Up',
                         'Occupancy_Up', 'Eigenvalues_Down', 'Occupancy_Down']
 
-        # Reading the data using read_csv from the simulated file
-        df = pd.read_csv(data_io, delim_whitespace=True,
-                         names=column_names, skiprows=1)
-
-        df['Eigenvalues_Up'] *= ureg.eV
-        df['Eigenvalues_Down'] *= ureg.eV
-
-        return Data(data={'UpDownOrbitals': df}, comment="`UpDownOrbitals` is pandas DataFrame with columns: Band, Eigenvalues_Up, Occupancy_Up, Eigenvalues_Down, Occupancy_Down")
+        # The table is purely numeric after the two header lines, so it is
+        # parsed in one go by numpy instead of going through read_csv
+        lines = self.raw_data.split('\n', 2)
+        if len(lines) < 3 or not lines[2].strip():
+            raise ExtractionError("No orbital energies found in the data.")
+        try:
+            values = np.loadtxt(StringIO(lines[2]), ndmin=2)
+        except ValueError as e:
+            raise ExtractionError(
+                f"Could not parse the orbital energies: {e}") from e
+        if values.shape[1] != len(column_names):
+            raise ExtractionError(
+                f"Expected {len(column_names)} columns of orbital energies, found {values.shape[1]}.")
+
+        df = pd.DataFrame(values, columns=column_names)
+        df['Band'] = df['Band'].astype(int)
+
+        # Units are tagged per column rather than stored as a pint.Quantity in
+        # every cell, which would turn the columns into object dtype
+        units = {'Eigenvalues_Up': ureg.eV, 'Eigenvalues_Down': ureg.eV}
+
+        return Data(data={'UpDownOrbitals': df, 'Units': units}, comment="`UpDownOrbitals` is pandas DataFrame with columns: Band, Eigenvalues_Up, Occupancy_Up, Eigenvalues_Down, Occupancy_Down. `Units` maps the Eigenvalues columns to their pint unit, eV")
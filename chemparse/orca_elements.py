@@ -7,7 +7,7 @@ import pandas as pd
 from .data import Data
 from .elements import AvailableBlocksGeneral, Block, Element, ExtractionError
 from .logging_config import logger
-from .units_and_constants import ureg
+from .units_and_constants import get_unit_registry
 
 
 class AvailableBlocksOrca(AvailableBlocksGeneral):
@@ -224,6 +224,7 @@ class BlockOrcaFinalSinglePointEnergy(Block):
             - :class:`pint.Quantity` `Energy`
         :rtype: Data
         """
+        ureg = get_unit_registry()
         pattern = r"FINAL SINGLE POINT ENERGY\s+(-?\d+\.\d+)"
 
         # Search for the pattern in the text
@@ -370,6 +371,7 @@ class BlockOrcaDipoleMoment(BlockOrcaWithStandardHeader):
 
         :rtype: Data
         """
+        ureg = get_unit_registry()
         # extract the data after the XYZ line
 
         pattern = r"([ \t]*X[ \t]+Y[ \t]+Z[ \t]*\n)"
@@ -558,6 +560,7 @@ class BlockOrcaOrbitalEnergies(BlockOrcaWithStandardHeader):
                 These values are extracted from the output file and should match unless there's an error in the ORCA output.
         :rtype: Data
         """
+        ureg = get_unit_registry()
         # Define regex pattern for extracting orbital data lines
         pattern_orbital_data = r"\s*(\d+)\s+(\d+\.\d{4})\s+(-?\d+\.\d+)\s+(-?\d+\.\d+)\s*"
 
@@ -692,6 +695,7 @@ class BlockOrcaTotalScfEnergy(BlockOrcaWithStandardHeader):
 
         :rtype: Data
         """
+        ureg = get_unit_registry()
         data_dict = {}
         current_section = None
 
@@ -791,6 +795,7 @@ class BlockOrcaTddftExcitedStatesSinglets(BlockOrcaWithStandardHeader):
 
         :rtype: Data
         """
+        ureg = get_unit_registry()
         states_data = {}
 
         state_number = None
@@ -1,16 +1,371 @@
+import functools
+import operator
+import os
 import re
+import sys
 import time
 import warnings
-from typing import Pattern, Union
+from typing import Callable, Iterator, Pattern, Union
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_constants
+    import sre_parse
 
 from tqdm import tqdm
 
-from .elements import Block, Element, Spacer
+from .elements import Block, Element, Spacer, _next_element_id
 from .gpaw_elements import AvailableBlocksGpaw
 from .logging_config import logger
 from .orca_elements import AvailableBlocksOrca
 from .vasp_elements import AvailableBlocksVasp
 
+_regex_engine = re
+_regex_fallback = re
+_regex_engine_name = os.environ.get('CHEMPARSE_REGEX_ENGINE', '').lower()
+if _regex_engine_name == 'regex':
+    # The third-party `regex` engine is opt-in, it accepts the same syntax
+    # and flags but is faster on some of the heavier block patterns
+    try:
+        import regex as _regex_engine
+    except ImportError:
+        logger.warning(
+            "CHEMPARSE_REGEX_ENGINE is set to 'regex' but the `regex` package is not installed. Falling back to `re`.")
+elif _regex_engine_name == 're2':
+    # RE2 matches in linear time, but has no backreferences or lookarounds,
+    # patterns using them go to `regex` if installed, whose atomic groups and
+    # possessive quantifiers still bound backtracking, and to `re` otherwise
+    try:
+        import re2 as _regex_engine
+    except ImportError:
+        logger.warning(
+            "CHEMPARSE_REGEX_ENGINE is set to 're2' but the `google-re2` package is not installed. Falling back to `re`.")
+    else:
+        try:
+            import regex as _regex_fallback
+        except ImportError:
+            pass
+
+_regex_error = getattr(_regex_engine, 'error', re.error)
+"""The exception raised by the active engine for an invalid pattern."""
+
+_VALID_FLAGS = {
+    "IGNORECASE": re.IGNORECASE,
+    "MULTILINE": re.MULTILINE,
+    "DOTALL": re.DOTALL,
+    "UNICODE": re.UNICODE,
+    "VERBOSE": re.VERBOSE
+}
+"""Maps the supported regex flag names to their `re` values."""
+
+_VALID_FLAGS_ITEMS = tuple(_VALID_FLAGS.items())
+
+_MODE_TABLE = {
+    'ORCA': AvailableBlocksOrca,
+    'GPAW': AvailableBlocksGpaw,
+    'VASP': AvailableBlocksVasp,
+}
+"""Maps the processing mode to the registry of blocks available in it."""
+
+
+def _flags_to_int(flag_names: list[str]) -> int:
+    """
+    Combines regex flag names into their integer representation. Settings reuse a handful of flag combinations, so each one is converted only once.
+
+    :param flag_names: The regex flag names, matched case-insensitively against the supported flags.
+    :type flag_names: list[str]
+    :return: The bitwise OR of the named flags, 0 for an empty list.
+    :rtype: int
+    :raises ValueError: If an unsupported flag name is included in the input list.
+    """
+    return _flag_tuple_to_int(tuple(flag_names))
+
+
+@functools.lru_cache(maxsize=4096)
+def _flag_tuple_to_int(flag_names: tuple[str, ...]) -> int:
+    """
+    Combines a tuple of regex flag names into their integer representation, see `_flags_to_int`.
+
+    :param flag_names: The regex flag names.
+    :type flag_names: tuple[str, ...]
+    :return: The bitwise OR of the named flags.
+    :rtype: int
+    :raises ValueError: If an unsupported flag name is included.
+    """
+    try:
+        return functools.reduce(operator.or_,
+                                [_VALID_FLAGS[flag_name.upper()]
+                                 for flag_name in flag_names],
+                                0)
+    except KeyError:
+        invalid = next(flag_name for flag_name in flag_names
+                       if flag_name.upper() not in _VALID_FLAGS)
+        raise ValueError(f"Invalid flag: {invalid}") from None
+
+
+@functools.lru_cache(maxsize=4096)
+def _int_to_flag_names(flags: int) -> tuple[str, ...]:
+    """
+    Splits combined integer flags into the names of the supported flags they contain, cached like `_flags_to_int`.
+
+    :param flags: The combined regex flags.
+    :type flags: int
+    :return: The names of the contained flags, in the order of `_VALID_FLAGS`.
+    :rtype: tuple[str, ...]
+    """
+    return tuple(flag_name for flag_name, flag_value in _VALID_FLAGS_ITEMS
+                 if flags & flag_value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_cached(pattern: str, flags: int) -> Pattern:
+    """
+    Compiles a regex pattern, sharing the compiled object between all requests with the same pattern and flags.
+
+    The pattern is compiled with `re` unless the `CHEMPARSE_REGEX_ENGINE` environment variable is set to 'regex' or 're2' and the matching package is installed. Patterns the chosen engine rejects, such as backreferences under RE2, fall back to `regex` when RE2 is chosen and it is installed, and to `re` otherwise.
+
+    :param pattern: The regular expression pattern.
+    :type pattern: str
+    :param flags: The combined regex flags.
+    :type flags: int
+    :return: The compiled regex pattern object. Patterns compiled by RE2 or `regex` are wrapped, so that `pattern` and `flags` read as with `re`.
+    :rtype: Pattern
+    """
+    if _regex_engine is re:
+        return re.compile(pattern, flags)
+    try:
+        if _regex_engine.__name__ == 're2':
+            return _compile_re2(pattern, flags)
+        # Wrapped like RE2 patterns, as `regex` adds its own flags
+        return _WrappedPattern(_regex_engine.compile(pattern, flags),
+                               pattern, flags)
+    except _regex_error:
+        if _regex_fallback is not re:
+            try:
+                return _WrappedPattern(_regex_fallback.compile(pattern, flags),
+                                       pattern, flags)
+            except _regex_fallback.error:
+                pass
+        return re.compile(pattern, flags)
+
+
+class _WrappedPattern:
+    """
+    A pattern compiled by an engine other than `re`, exposing the `Pattern` attributes the package and its callers rely on.
+
+    `pattern` is the source as given and `flags` the `re` flags as `re.compile` reports them, whatever the engine added to either. Matching methods and other attributes, such as `finditer` or `groupindex`, are taken from the wrapped pattern.
+    """
+
+    __slots__ = ('_compiled', 'pattern', 'flags')
+
+    def __init__(self, compiled, pattern: str, flags: int) -> None:
+        self._compiled = compiled
+        self.pattern: str = pattern
+        # `re` includes UNICODE in the flags of every str pattern
+        self.flags: int = int(flags | re.UNICODE)
+
+    def __getattr__(self, name: str):
+        # Dunder lookups, e.g. by copy and pickle, must not reach the wrapped
+        # pattern, which is not set yet on a bare instance
+        if name.startswith('__') or name == '_compiled':
+            raise AttributeError(name)
+        return getattr(self._compiled, name)
+
+    def __repr__(self) -> str:
+        return f"{self.engine}.compile({self.pattern!r}, {self.flags!r})"
+
+    @property
+    def engine(self) -> str:
+        """
+        The name of the engine that compiled the wrapped pattern.
+
+        :rtype: str
+        """
+        # `regex` patterns are defined in its `_regex` extension module
+        return type(self._compiled).__module__.partition('.')[0].lstrip('_')
+
+
+def _compile_re2(pattern: str, flags: int) -> _WrappedPattern:
+    """
+    Compiles a regex pattern with RE2, translating the `re` flags into RE2 options.
+
+    RE2 only has an option for `re.MULTILINE` in POSIX syntax mode, so it is passed as an inline flag instead. Errors are not logged by RE2, as rejected patterns are expected and compiled by the fallback engine.
+
+    :param pattern: The regular expression pattern.
+    :type pattern: str
+    :param flags: The combined regex flags.
+    :type flags: int
+    :return: The compiled RE2 pattern, wrapped to report `pattern` and `flags` like `re` does.
+    :rtype: _WrappedPattern
+    :raises re2.error: If the pattern uses syntax or flags RE2 does not support.
+    """
+    if flags & re.VERBOSE:
+        raise _regex_error("RE2 does not support verbose patterns")
+    options = _regex_engine.Options()
+    options.log_errors = False
+    options.case_sensitive = not flags & re.IGNORECASE
+    options.dot_nl = bool(flags & re.DOTALL)
+    source = f"(?m){pattern}" if flags & re.MULTILINE else pattern
+    return _WrappedPattern(_regex_engine.compile(source, options), pattern,
+                           flags)
+
+
+@functools.lru_cache(maxsize=4096)
+def _required_literal(pattern: str, flags: int) -> str:
+    """
+    Finds the longest run of literal characters that every match of the pattern must contain.
+
+    Only literals that are matched unconditionally are considered: anything inside alternations, optional or repeated parts and lookarounds interrupts the run. Case-insensitive patterns have no usable literal.
+
+    :param pattern: The regular expression pattern.
+    :type pattern: str
+    :param flags: The combined regex flags the pattern is compiled with.
+    :type flags: int
+    :return: The required literal, or an empty string if there is none.
+    :rtype: str
+    """
+    if flags & re.IGNORECASE:
+        return ''
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return ''
+    if parsed.state.flags & re.IGNORECASE:
+        return ''
+
+    runs = ['']
+
+    def walk(items) -> None:
+        for op, av in items:
+            if op is sre_constants.LITERAL:
+                runs[-1] += chr(av)
+            elif op is sre_constants.SUBPATTERN and not av[1] & re.IGNORECASE:
+                # A group is matched in place, so its literals continue the run
+                walk(av[3])
+            else:
+                runs.append('')
+
+    walk(parsed)
+    return max(runs, key=len)
+
+
+def _intern(value):
+    """
+    Interns a string, so equal strings share one object. Only strings can be interned, other values are returned as given.
+
+    :param value: The value to intern.
+    :type value: object
+    :return: The interned string, or `value` itself if it is not a string.
+    :rtype: object
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _group_source(pattern: str, flags: int, name: str = '') -> str:
+    """
+    Wraps a pattern in a group, named if `name` is given, so it can be used as one alternative of a larger pattern.
+
+    :param pattern: The regular expression pattern.
+    :type pattern: str
+    :param flags: The combined regex flags; in verbose patterns the group is closed on a new line, so a trailing comment cannot swallow it.
+    :type flags: int
+    :param name: The name of the group, a non-capturing group is used if empty.
+    :type name: str
+    :return: The wrapped pattern.
+    :rtype: str
+    """
+    newline = "\n" if flags & re.VERBOSE else ""
+    group = f"(?:{pattern}{newline})"
+    return f"(?P<{name}>{group})" if name else group
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_self_contained(pattern: str, flags: int) -> bool:
+    """
+    Checks whether a pattern can be placed inside a larger alternation without changing its meaning.
+
+    This excludes patterns with backreferences or conditionals, whose group numbers would shift, named groups, which could collide with those of other patterns, and inline global flags, which would apply to the whole alternation.
+
+    :param pattern: The regular expression pattern.
+    :type pattern: str
+    :param flags: The combined regex flags the pattern is compiled with.
+    :type flags: int
+    :return: `True` if the pattern can be combined with others.
+    :rtype: bool
+    """
+    try:
+        with warnings.catch_warnings():
+            # Python < 3.11 only warns about global flags inside a group
+            warnings.simplefilter('error', DeprecationWarning)
+            parsed = sre_parse.parse(_group_source(pattern, flags), flags)
+    except (re.error, DeprecationWarning):
+        return False
+    if parsed.state.groupdict:
+        return False
+    return next(_group_references(parsed), None) is None
+
+
+@functools.lru_cache(maxsize=4096)
+def _has_no_groups(pattern: str, flags: int) -> bool:
+    """
+    Checks whether a pattern can be inserted into a larger one without changing its group numbers: it must be self-contained, see `_is_self_contained`, and have no capture groups of its own.
+
+    :param pattern: The regular expression pattern.
+    :type pattern: str
+    :param flags: The combined regex flags the pattern is compiled with.
+    :type flags: int
+    :return: `True` if the pattern defines and references no groups.
+    :rtype: bool
+    """
+    if not _is_self_contained(pattern, flags):
+        return False
+    return sre_parse.parse(pattern, flags).state.groups == 1
+
+
+def _refers_back_only(beginning: str, ending: str, flags: int) -> bool:
+    """
+    Checks that the backreferences and conditionals of a pattern split into `beginning` and `ending` only refer to groups opened in `beginning`, whose numbers stay the same when groups are inserted between the two parts.
+
+    :param beginning: The part of the pattern before the insertion point.
+    :type beginning: str
+    :param ending: The part of the pattern after the insertion point.
+    :type ending: str
+    :param flags: The combined regex flags the pattern is compiled with.
+    :type flags: int
+    :return: `True` if no reference points at or after the insertion point.
+    :rtype: bool
+    """
+    try:
+        parsed = sre_parse.parse(f"{beginning}(?P<_inserted>){ending}", flags)
+    except re.error:
+        return False
+    inserted = parsed.state.groupdict['_inserted']
+    return all(group < inserted for group in _group_references(parsed))
+
+
+def _group_references(items) -> Iterator[int]:
+    """
+    Yields the numbers of the groups that the backreferences and conditionals of a parsed pattern refer to, including those in nested parts.
+
+    :param items: The parsed pattern, as returned by `sre_parse.parse`, or a part of it.
+    :type items: sre_parse.SubPattern
+    :return: The referenced group numbers, in pattern order.
+    :rtype: Iterator[int]
+    """
+    for op, av in items:
+        if op is sre_constants.GROUPREF:
+            yield av
+        elif op is sre_constants.GROUPREF_EXISTS:
+            yield av[0]
+        for arg in av if isinstance(av, (tuple, list)) else (av,):
+            for sub in arg if isinstance(arg, list) else (arg,):
+                if isinstance(sub, sre_parse.SubPattern):
+                    yield from _group_references(sub)
+
 
 class RegexRequest:
     """
@@ -30,11 +385,14 @@ class RegexRequest:
     :vartype comment: str
     """
 
+    __slots__ = ('_compiled', 'p_type', 'p_subtype', '_pattern', 'comment',
+                 '_flags')
+
     def __init__(self,
                  p_type: str,
                  p_subtype: str,
                  pattern: str,
-                 flags: list[str],
+                 flags: list[str] | int,
                  comment: str = '') -> None:
         """
         Initializes a `RegexRequest` instance with a specified pattern, flags, and optional comment.
@@ -45,42 +403,65 @@ class RegexRequest:
         :type p_subtype: str
         :param pattern: The regular expression pattern to be used for text matching.
         :type pattern: str
-        :param flags: A list of strings representing the regex flags to be applied, such as 'MULTILINE' or 'IGNORECASE'.
-        :type flags: list[str]
+        :param flags: A list of strings representing the regex flags to be applied, such as 'MULTILINE' or 'IGNORECASE', or their already combined integer value.
+        :type flags: list[str] | int
         :param comment: A descriptive note or comment about the regex request, intended to provide clarity or context.
         :type comment: str, optional
+        :raises ValueError: If a flag is not supported or the pattern is not a valid regular expression.
         """
-        self.p_type: str = p_type
-        self.p_subtype: str = p_subtype
-        self.pattern: str = pattern
-        self.comment: str = comment
-        self.flags: int = self._compile_flags(flags)
+        self._compiled: Pattern | None = None
+        # Settings repeat the same few types and comments across many
+        # requests, interning keeps a single copy of each
+        self.p_type: str = _intern(p_type)
+        self.p_subtype: str = _intern(p_subtype)
+        self.pattern = pattern
+        self.comment: str = _intern(comment)
+        self.flags = self._compile_flags(flags)
+        # Compile right away so a malformed pattern fails when the settings
+        # are loaded; requests with the same pattern and flags share one object
+        self.compile()
+
+    @property
+    def pattern(self) -> str:
+        """
+        The regular expression pattern used for matching text. Assigning a new pattern drops the cached compiled pattern.
+
+        :rtype: str
+        """
+        return self._pattern
+
+    @pattern.setter
+    def pattern(self, pattern: str) -> None:
+        self._pattern: str = pattern
+        self._compiled = None
+
+    @property
+    def flags(self) -> int:
+        """
+        The combined regex flags compiled into an integer. Assigning new flags drops the cached compiled pattern.
+
+        :rtype: int
+        """
+        return self._flags
 
-    def _compile_flags(self, flag_names: list[str]) -> int:
+    @flags.setter
+    def flags(self, flags: int) -> None:
+        self._flags: int = flags
+        self._compiled = None
+
+    def _compile_flags(self, flag_names: list[str] | int) -> int:
         """
         Compiles regex flag names into a combined integer representation.
 
-        :param flag_names: A list of regex flag names to be compiled. Supported flags include 'IGNORECASE', 'MULTILINE', 'DOTALL', 'UNICODE', and 'VERBOSE'.
-        :type flag_names: list[str]
+        :param flag_names: A list of regex flag names to be compiled. Supported flags include 'IGNORECASE', 'MULTILINE', 'DOTALL', 'UNICODE', and 'VERBOSE'. An integer is taken as already compiled and returned unchanged.
+        :type flag_names: list[str] | int
         :return: The compiled integer value representing the combination of the provided regex flags.
         :rtype: int
         :raises ValueError: If an unsupported flag name is included in the input list.
         """
-        compiled_flags = 0
-        valid_flags = {
-            "IGNORECASE": re.IGNORECASE,
-            "MULTILINE": re.MULTILINE,
-            "DOTALL": re.DOTALL,
-            "UNICODE": re.UNICODE,
-            "VERBOSE": re.VERBOSE
-        }
-        for flag_name in flag_names:
-            flag = valid_flags.get(flag_name.upper())
-            if flag is not None:
-                compiled_flags |= flag
-            else:
-                raise ValueError(f"Invalid flag: {flag_name}")
-        return compiled_flags
+        if isinstance(flag_names, int):
+            return flag_names
+        return _flags_to_int(flag_names)
 
     def _decompile_flags(self) -> list[str]:
         """
@@ -89,18 +470,7 @@ class RegexRequest:
         :return: A list of flag names corresponding to the combined flags integer.
         :rtype: list[str]
         """
-        valid_flags = {
-            "IGNORECASE": re.IGNORECASE,
-            "MULTILINE": re.MULTILINE,
-            "DOTALL": re.DOTALL,
-            "UNICODE": re.UNICODE,
-            "VERBOSE": re.VERBOSE
-        }
-        flag_names = [
-            flag_str for flag_str, flag_val in valid_flags.items()
-            if self.flags & flag_val
-        ]
-        return flag_names
+        return list(_int_to_flag_names(self.flags))
 
     def validate_configuration(self) -> None:
         """
@@ -125,16 +495,112 @@ class RegexRequest:
             "comment": self.comment
         }
 
+    @property
+    def engine(self) -> str:
+        """
+        The name of the regex engine the pattern was compiled with: 're', 'regex' or 're2'.
+
+        :rtype: str
+        """
+        compiled = self.compile()
+        if isinstance(compiled, _WrappedPattern):
+            return compiled.engine
+        return 're'
+
+    @property
+    def compiled(self) -> Pattern:
+        """
+        The compiled regex pattern, see `compile`.
+
+        :rtype: Pattern
+        """
+        return self.compile()
+
     def compile(self) -> Pattern:
         """
         Compiles the regex pattern with the specified flags into a regex pattern object.
 
-        This compiled object can be used for various regex operations like `findall`, `search`, `match`, etc., enabling efficient pattern matching.
+        This compiled object can be used for various regex operations like `findall`, `search`, `match`, etc., enabling efficient pattern matching. The pattern is compiled on the first call and reused until `pattern` or `flags` change.
 
         :return: A compiled regex pattern object, ready for use in pattern matching operations.
         :rtype: Pattern
+        :raises ValueError: If the pattern is not a valid regular expression.
+        """
+        if self._compiled is None:
+            try:
+                self._compiled = _compile_cached(self.pattern, self.flags)
+            except (re.error, _regex_error) as e:
+                raise ValueError(
+                    f"Invalid regex pattern for '{self.p_subtype}': {e}") from e
+        return self._compiled
+
+    def search(self, string: str, *args) -> re.Match | None:
+        """
+        Scans a string for the first match of the compiled pattern, see `re.Pattern.search`.
+
+        :param string: The string to search.
+        :type string: str
+        :return: The first match, or `None` if there is none.
+        :rtype: re.Match | None
+        """
+        return self.compile().search(string, *args)
+
+    def finditer(self, string: str, *args) -> Iterator[re.Match]:
+        """
+        Iterates over all non-overlapping matches of the compiled pattern in a string, see `re.Pattern.finditer`.
+
+        :param string: The string to search.
+        :type string: str
+        :return: An iterator over the matches.
+        :rtype: Iterator[re.Match]
+        """
+        return self.compile().finditer(string, *args)
+
+    def sub(self, repl: str | Callable[[re.Match], str], string: str, count: int = 0) -> str:
+        """
+        Replaces the matches of the compiled pattern in a string, see `re.Pattern.sub`.
+
+        :param repl: The replacement string or a function called for every match.
+        :type repl: str | Callable[[re.Match], str]
+        :param string: The string to process.
+        :type string: str
+        :param count: The maximum number of replacements, 0 for all.
+        :type count: int
+        :return: The string with the matches replaced.
+        :rtype: str
+        """
+        return self.compile().sub(repl, string, count)
+
+    def _element_factory(self, available_blocks) -> Callable[..., Element]:
         """
-        return re.compile(self.pattern, self.flags)
+        Selects the callable that creates elements for matches of this request.
+
+        :param available_blocks: The registry of blocks available in the current mode.
+        :type available_blocks: type
+        :return: The element class for the request type and subtype, or a fallback that logs a warning and creates a plain `Block`.
+        :rtype: Callable[..., Element]
+        :raises ValueError: If the request type is neither 'Block' nor 'Spacer'.
+        """
+        if self.p_type == "Spacer":
+            return Spacer
+        if self.p_type != "Block":
+            raise ValueError(f"Type '{self.p_type}' is not recognized.")
+
+        subtype_cls = available_blocks.blocks.get(self.p_subtype)
+        if subtype_cls is not None:
+            return subtype_cls
+
+        # The warning is logged for every match, format it only once
+        message = (f"Subtype `{self.p_subtype}`"
+                   f" not recognized. Falling back to Block.")
+
+        def fallback_block(raw_data, char_position=None, line_position=None):
+            logger.warning(message)
+            return Block(raw_data,
+                         char_position=char_position,
+                         line_position=line_position)
+
+        return fallback_block
 
     def apply(self,
               marked_text: list[tuple[tuple[int, int], tuple[int, int],
@@ -153,24 +619,24 @@ class RegexRequest:
         :param show_progress: Indicates whether a progress indicator should be shown during the extraction process. Useful for long-running operations.
         :type show_progress: bool
 
-        :return: A tuple containing the updated marked text and a dictionary mapping extracted elements to their positions.
+        :return: A tuple containing the updated marked text (a new list, the input is left unchanged) and a dictionary mapping extracted elements to their positions.
         :rtype: tuple[str, dict[str, dict]]
         """
 
-        if mode == 'ORCA':
-            AB = AvailableBlocksOrca
-        elif mode == 'GPAW':
-            AB = AvailableBlocksGpaw
-        elif mode == 'VASP':
-            AB = AvailableBlocksVasp
-        else:
-            raise ValueError(f"Mode '{mode}' is not recognized.")
+        try:
+            AB = _MODE_TABLE[mode]
+        except KeyError:
+            raise ValueError(f"Mode '{mode}' is not recognized.") from None
 
         if isinstance(marked_text, str):
             marked_text = [((0, len(marked_text)),
                             (1, marked_text.count('\n') + 1), marked_text)]
 
         compiled_pattern = self.compile()
+        required_literal = _required_literal(self.pattern, self.flags)
+        # Type and subtype are fixed for the whole call, so pick the element
+        # constructor once instead of branching on them for every match
+        element_cls = self._element_factory(AB)
         elements_dict = {}
 
         total_chars = marked_text[-1][0][1]
@@ -226,137 +692,128 @@ class RegexRequest:
             def break_block(block, elements_dict, progress_callback=None):
                 char_pos, line_pos, text = block
 
-                def convert_to_tuples(text_list, progress_callback=None):
-                    result = []
-                    # Start from the first character
-                    current_char_pos = char_pos[0]
-                    current_line_pos = line_pos[0]  # Start from the first line
-
-                    for item in text_list:
-                        if item is None or len(item) == 0:
-                            continue
-                        char_start = current_char_pos
-                        # -1 because end is inclusive
-                        char_end = current_char_pos + len(item) - 1
-
-                        # Count the lines in the current segment
-                        lines_in_item = item.count('\n')
-                        line_start = current_line_pos
-                        line_end = current_line_pos + lines_in_item
-
-                        # Update for the next iteration
-                        current_char_pos = char_end + 1
-                        current_line_pos = line_end + 1 if lines_in_item > 0 else current_line_pos
+                # Bind the names used per segment once, so the loop below
+                # resolves them as fast locals instead of attribute lookups
+                finditer = compiled_pattern.finditer
+                count = text.count
+                fullmatch = compiled_pattern.fullmatch
+                next_element_id = _next_element_id
 
-                        result.append(((char_start, char_end),
-                                       (line_start, line_end), item))
-
-                    return result
-
-                def convert_to_element(item,
-                                       elements_dict,
-                                       compiled_pattern,
-                                       progress_callback=None):
+                if text and required_literal not in text:
+                    # The pattern cannot match anywhere in this block, skip the regex scan
+                    char_end = char_pos[0] + len(text) - 1
                     if progress_callback:
-                        progress_callback(item[0][1], block_position=item[0])
-                    if compiled_pattern.fullmatch(item[2]):
-                        char_pos, line_pos, extracted_text = item
-
-                        if self.p_type == "Block":
-                            if self.p_subtype in AB.blocks:
-                                # Create an instance of the class with position parameter
-                                element_instance = AB.blocks[self.p_subtype](
-                                    extracted_text,
-                                    char_position=char_pos,
-                                    line_position=line_pos)
-                            else:
-                                logger.warning(
-                                    (f"Subtype `{self.p_subtype}`"
-                                     f" not recognized. Falling back to Block."
-                                     ))
-                                element_instance = Block(
-                                    extracted_text,
-                                    char_position=char_pos,
-                                    line_position=line_pos)
-                        elif self.p_type == "Spacer":
-                            element_instance = Spacer(extracted_text,
-                                                      char_position=char_pos,
-                                                      line_position=line_pos)
-
-                        elements_dict[hash(element_instance)] = {
-                            'Element': element_instance,
-                            'CharPosition': char_pos,
-                            'LinePosition': line_pos
-                        }
-
-                        return (char_pos, line_pos, element_instance)
-
-                    return item
-
-                def split_by_full_matches(text, compiled_pattern):
-                    segments = []
-                    start = 0
-
-                    for match in compiled_pattern.finditer(text):
-                        # Add the text leading up to the match (if any)
-                        if match.start() > start:
-                            segments.append(text[start:match.start()])
-
-                        # Add the matched text
-                        segments.append(match.group())
-
-                        # Update the start position for the next iteration
-                        start = match.end()
-
-                    # Add any remaining text after the last match
-                    if start < len(text):
-                        segments.append(text[start:])
-
-                    return segments
+                        progress_callback(
+                            char_end, block_position=(char_pos[0], char_end))
+                    return [((char_pos[0], char_end),
+                             (line_pos[0], line_pos[0] + count('\n')),
+                             text)], elements_dict
 
                 # split by full matches instead of re split to allow the internal groups in regex
-                text_list = split_by_full_matches(text, compiled_pattern)
-
-                text_list = convert_to_tuples(
-                    text_list, progress_callback=progress_callback)
-
-                text_list = [
-                    convert_to_element(item,
-                                       elements_dict,
-                                       compiled_pattern,
-                                       progress_callback=progress_callback)
-                    for item in text_list
-                ]
-
-                return text_list, elements_dict
-
-            i = 0
-            while i < len(marked_text):
+                matches = list(finditer(text))
+                # Every match adds at most a gap and itself, plus the tail after the last one
+                spans = [None] * (2 * len(matches) + 1)
+                n_spans = 0
+                start = 0
+                for match in matches:
+                    match_start, match_end = match.span()
+                    # The text leading up to the match (if any) and the match itself
+                    if match_start > start:
+                        spans[n_spans] = (start, match_start)
+                        n_spans += 1
+                    spans[n_spans] = (match_start, match_end)
+                    n_spans += 1
+                    start = match_end
+                # Any remaining text after the last match
+                if start < len(text):
+                    spans[n_spans] = (start, len(text))
+                    n_spans += 1
+                del spans[n_spans:]
+
+                result = [None] * n_spans
+                n_result = 0
+                n_elements = 0
+                # Start from the first character and the first line
+                current_char_pos = char_pos[0]
+                current_line_pos = line_pos[0]
+
+                for span_start, span_end in spans:
+                    if span_end == span_start:
+                        continue
+                    char_start = current_char_pos
+                    # -1 because end is inclusive
+                    char_end = current_char_pos + span_end - span_start - 1
+
+                    # Count the lines of the current segment in place, the running
+                    # counters carry the line position over to the next segment
+                    lines_in_item = count('\n', span_start, span_end)
+                    line_start = current_line_pos
+                    line_end = current_line_pos + lines_in_item
+
+                    # Update for the next iteration
+                    current_char_pos = char_end + 1
+                    current_line_pos = line_end + 1 if lines_in_item > 0 else current_line_pos
+
+                    item = text[span_start:span_end]
+                    item_char_pos = (char_start, char_end)
+                    item_line_pos = (line_start, line_end)
+
+                    if not fullmatch(item):
+                        result[n_result] = (item_char_pos, item_line_pos, item)
+                        n_result += 1
+                        continue
+
+                    # Create an instance of the class with position parameter
+                    element_instance = element_cls(item,
+                                                   char_position=item_char_pos,
+                                                   line_position=item_line_pos)
+
+                    elements_dict[next_element_id()] = {
+                        'Element': element_instance,
+                        'CharPosition': item_char_pos,
+                        'LinePosition': item_line_pos
+                    }
+                    result[n_result] = (
+                        item_char_pos, item_line_pos, element_instance)
+                    n_result += 1
+
+                    # Report only every 64th element, the callback is throttled
+                    # in time anyway and gaps between them carry no news
+                    n_elements += 1
+                    if progress_callback and not n_elements % 64:
+                        progress_callback(
+                            char_end, block_position=item_char_pos)
+
+                if progress_callback:
+                    progress_callback(current_char_pos - 1,
+                                      block_position=char_pos)
+
+                # Empty matches produce no segment
+                del result[n_result:]
+                return result, elements_dict
+
+            # Rebuild the list in one pass instead of splicing every broken
+            # block into place, which shifted the whole tail each time
+            new_marked_text = []
+            append = new_marked_text.append
+            extend = new_marked_text.extend
+            for block in marked_text:
                 # Assuming the structure is [(tuple, tuple, str/Element)]
-                if isinstance(marked_text[i][2], str):
-                    result, elements_dict = break_block(
-                        marked_text[i],
-                        elements_dict,
-                        progress_callback=progress_callback)
-                    if result:
-                        # Remove the original item
-                        del marked_text[i]
-
-                        # Insert the new items from 'result' at position 'i'
-                        # for item in reversed(result):
-                        #     marked_text.insert(i, item)
-                        marked_text[i:i] = result
-
-                        # Increment 'i' by the number of new items inserted
-                        i += len(result)
-                    else:
-                        # No blocks found, move to the next item
-                        i += 1
+                if type(block[2]) is not str:
+                    # Already an Element, keep it as is
+                    append(block)
+                    continue
+                result, elements_dict = break_block(
+                    block,
+                    elements_dict,
+                    progress_callback=progress_callback)
+                if result:
+                    extend(result)
                 else:
-                    # The item is not a string, move to the next item
-                    i += 1
+                    # Nothing to split (empty text), keep the original item
+                    append(block)
 
-            return marked_text, elements_dict
+            return new_marked_text, elements_dict
 
         marked_text, elements_dict = process_marked_text(
             marked_text=marked_text, elements_dict=elements_dict)
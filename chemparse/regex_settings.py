@@ -1,12 +1,37 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import re
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Pattern
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, msgspec or json are used without it
+    orjson = None
+
+try:
+    import msgspec.json as msgspec_json
+except ImportError:  # msgspec is optional as well
+    msgspec_json = None
 
 from .logging_config import logger
-from .regex_request import RegexRequest
+from .regex_request import (_VALID_FLAGS, RegexRequest, _compile_cached,
+                            _flags_to_int, _group_source, _has_no_groups,
+                            _is_self_contained, _refers_back_only,
+                            _regex_error)
+
+_VALID_FLAG_NAMES = frozenset(_VALID_FLAGS)
+"""The flag names accepted in a blueprint's `pattern_structure`."""
+
+if orjson is not None:
+    _json_loads = orjson.loads
+elif msgspec_json is not None:
+    _json_loads = msgspec_json.decode
+else:
+    _json_loads = json.loads
+"""Parses JSON from bytes with the fastest installed parser: `orjson`, `msgspec` or the standard `json` module."""
 
 
 class RegexBlueprint:
@@ -20,7 +45,7 @@ class RegexBlueprint:
 
     :param list[str] order: The ordered list of keys that defines the sequence of generated RegexRequest objects.
     :param dict[str, str] pattern_structure: A dictionary defining the common structure of regex patterns,
-        including `beginning`, `ending`, and `flags` keys.
+        including `beginning`, `ending`, and `flags` keys, and optionally `escape_texts` to match the pattern texts literally.
     :param dict[str, str] pattern_texts: A dictionary mapping each key in the `order` list to a specific
         text snippet to be inserted into the pattern structure.
     :param str comment: A comment or description associated with this blueprint.
@@ -79,6 +104,9 @@ class RegexBlueprint:
 
     """
 
+    __slots__ = ('order', 'pattern_structure', 'pattern_texts', 'comment',
+                 'items', '_flag_int')
+
     def __init__(self, order: list[str], pattern_structure: dict[str, str], pattern_texts: dict[str, str], comment: str) -> None:
         """
         Initializes a RegexBlueprint instance, which serves as a template for generating RegexRequest objects.
@@ -95,6 +123,9 @@ class RegexBlueprint:
         self.pattern_structure: dict[str, str] = pattern_structure
         self.pattern_texts: dict[str, str] = pattern_texts
         self.comment: str = comment
+        self._validate_structure()
+        # Shared by every item, so the flag names are converted only once
+        self._flag_int: int = _flags_to_int(pattern_structure['flags'])
         self._initialize_items()
 
     def _initialize_items(self) -> None:
@@ -103,18 +134,47 @@ class RegexBlueprint:
 
         This method constructs each regex pattern by combining the predefined structure with the specific text snippets, and then initializes `RegexRequest` objects with these patterns.
         """
-        self.items: dict[str, RegexRequest] = {}
-        for name, text in self.pattern_texts.items():
-            pattern = (f"{self.pattern_structure['beginning']}"
-                       f"{text}{self.pattern_structure['ending']}")
-            regex_request = RegexRequest(
-                p_type="Block",
-                p_subtype=name,
-                pattern=pattern,
-                flags=self.pattern_structure['flags'],
-                comment=self.comment
-            )
-            self.items[name] = regex_request
+        self.items: dict[str, RegexRequest] = {
+            name: self._make_request(name, text)
+            for name, text in self.pattern_texts.items()
+        }
+
+    def _make_request(self, name: str, text: str) -> RegexRequest:
+        """
+        Creates the `RegexRequest` of one item by inserting its pattern text into the shared structure.
+
+        :param name: The key of the item, used as the request subtype.
+        :type name: str
+        :param text: The pattern text of the item.
+        :type text: str
+        :return: The request for the item, with the blueprint flags and comment.
+        :rtype: RegexRequest
+        """
+        pattern_structure = self.pattern_structure
+        return RegexRequest(
+            p_type="Block",
+            p_subtype=name,
+            pattern="".join((pattern_structure['beginning'],
+                             self._regex_text(text),
+                             pattern_structure['ending'])),
+            flags=self._flag_int,
+            comment=self.comment
+        )
+
+    def _regex_text(self, text: str) -> str:
+        """
+        Returns a pattern text as it is inserted into the regex.
+
+        Pattern texts are regex source by default. If `pattern_structure` sets `escape_texts` to `True`, they are taken literally and escaped instead.
+
+        :param text: The pattern text of an item.
+        :type text: str
+        :return: The text to place between `beginning` and `ending`.
+        :rtype: str
+        """
+        if self.pattern_structure.get('escape_texts', False):
+            return re.escape(text)
+        return text
 
     def to_list(self) -> list[RegexRequest]:
         """
@@ -135,10 +195,28 @@ class RegexBlueprint:
         """
         # Check if all items in 'order' exist in 'pattern_texts'
         for name in self.order:
-            if name not in self.pattern_texts:
-                raise ValueError(
-                    f"Item '{name}' in 'order' does not have a corresponding entry in 'pattern_texts'.")
+            self._validate_item(name)
+
+        self._validate_structure()
+
+    def _validate_item(self, name: str) -> None:
+        """
+        Checks that an item listed in the `order` has a corresponding pattern text.
+
+        :param name: The key of the item to check.
+        :type name: str
+        :raises ValueError: If the item has no entry in `pattern_texts`.
+        """
+        if name not in self.pattern_texts:
+            raise ValueError(
+                f"Item '{name}' in 'order' does not have a corresponding entry in 'pattern_texts'.")
+
+    def _validate_structure(self) -> None:
+        """
+        Checks the parts shared by all items: the required `pattern_structure` keys, its flags and regex, and the comment.
 
+        :raises ValueError: If the shared structure is inconsistent or incorrect.
+        """
         # Ensure 'pattern_structure' contains required keys
         required_keys = ['beginning', 'ending', 'flags']
         for key in required_keys:
@@ -147,21 +225,26 @@ class RegexBlueprint:
                     f"'pattern_structure' is missing the required key: '{key}'.")
 
         # Validate 'flags' in 'pattern_structure'
-        valid_flags = {"IGNORECASE", "MULTILINE",
-                       "DOTALL", "UNICODE", "VERBOSE"}
-        for flag in self.pattern_structure['flags']:
-            if flag not in valid_flags:
-                raise ValueError(
-                    f"Invalid flag '{flag}' in 'pattern_structure'. Valid flags are: {', '.join(valid_flags)}.")
+        flags = self.pattern_structure['flags']
+        if not _VALID_FLAG_NAMES.issuperset(flags):
+            flag = next(
+                flag for flag in flags if flag not in _VALID_FLAG_NAMES)
+            raise ValueError(
+                f"Invalid flag '{flag}' in 'pattern_structure'. Valid flags are: {', '.join(_VALID_FLAGS)}.")
 
-        # Validate that 'beginning' + 'ending' patterns are valid regex patterns
+        # Validate that 'beginning' + 'ending' patterns are valid regex patterns,
+        # through the shared cache so repeated validation compiles them only once
         try:
-            re.compile(
-                self.pattern_structure['beginning'] + self.pattern_structure['ending'])
-        except re.error as e:
+            _compile_cached(
+                self.pattern_structure['beginning'] + self.pattern_structure['ending'], 0)
+        except (re.error, _regex_error) as e:
             raise ValueError(
                 f"Invalid regex pattern in 'pattern_structure': {e}")
 
+        if not isinstance(self.pattern_structure.get('escape_texts', False), bool):
+            raise ValueError(
+                "'escape_texts' in 'pattern_structure' must be a boolean.")
+
         # Confirm comment is a string
         if not isinstance(self.comment, str):
             raise ValueError("'comment' must be a string.")
@@ -176,18 +259,69 @@ class RegexBlueprint:
         :type pattern_text: str
         """
         self.pattern_texts[name] = pattern_text
-        pattern = (f"{self.pattern_structure['beginning']}"
-                   f"{pattern_text}{self.pattern_structure['ending']}")
-        regex_request = RegexRequest(
-            p_type="Block",
-            p_subtype=name,
-            pattern=pattern,
-            flags=self.pattern_structure['flags'],
-            comment=self.comment
-        )
-        self.items[name] = regex_request
+        self.items[name] = self._make_request(name, pattern_text)
         self.order.append(name)
-        self.validate_configuration()
+        # The structure was checked on creation and the other items are
+        # untouched, so only the new one needs checking
+        self._validate_item(name)
+
+    def extend(self, pattern_texts: Iterable[tuple[str, str]]) -> None:
+        """
+        Adds several items to the blueprint at once, like repeated calls to `add_item`.
+
+        :param pattern_texts: Pairs of item key and pattern text, added in the given order.
+        :type pattern_texts: Iterable[tuple[str, str]]
+        """
+        for name, pattern_text in pattern_texts:
+            self.pattern_texts[name] = pattern_text
+            self.items[name] = self._make_request(name, pattern_text)
+            self.order.append(name)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[str, re.Match]]:
+        """
+        Scans the text once for all items of the blueprint, yielding each match together with the item it belongs to.
+
+        The pattern texts are joined into one alternation between the shared `beginning` and `ending`, each in a group named after its item. Matches do not overlap: the leftmost match in the text wins, and at the same position the item that comes first in `order`. The group numbers of `beginning` stay those of the item patterns, so pattern texts with capture groups or backreferences, and an `ending` that refers to its own groups, cannot be matched this way.
+
+        :param text: The text to search.
+        :type text: str
+        :return: An iterator over the matched item name and the match, in text order.
+        :rtype: Iterator[tuple[str, re.Match]]
+        :raises ValueError: If an item name cannot be used as a regex group name, or the blueprint cannot be matched in one pass.
+        """
+        order = self.order
+        union = _compile_cached(self._union_pattern(), self._flag_int)
+        for match in union.finditer(text):
+            groups = match.groupdict()
+            # Exactly one item group takes part in a match
+            yield next(name for name in order if groups[name] is not None), match
+
+    def _union_pattern(self) -> str:
+        """
+        Builds the pattern of `iter_matches`, matching any item of the blueprint.
+
+        :return: The combined regex pattern.
+        :rtype: str
+        :raises ValueError: If an item name cannot be used as a regex group name, or the blueprint cannot be matched in one pass.
+        """
+        if invalid := [name for name in self.order if not name.isidentifier()]:
+            raise ValueError(
+                f"Item(s) '{', '.join(invalid)}' cannot be used as regex group names.")
+        flags = self._flag_int
+        texts = {name: self._regex_text(self.pattern_texts[name])
+                 for name in self.order}
+        if grouped := [name for name, text in texts.items()
+                       if not _has_no_groups(text, flags)]:
+            raise ValueError(
+                f"Pattern text(s) of '{', '.join(grouped)}' use groups or backreferences and cannot be matched in one pass.")
+        beginning = self.pattern_structure['beginning']
+        ending = self.pattern_structure['ending']
+        if not _refers_back_only(beginning, ending, flags):
+            raise ValueError(
+                "'ending' refers to its own groups and cannot be matched in one pass.")
+        alternatives = "|".join(f"(?P<{name}>{text})"
+                                for name, text in texts.items())
+        return f"{beginning}(?:{alternatives}){ending}"
 
     def to_dict(self) -> dict[str, list[str] | dict[str, str | list[str]] | str]:
         """
@@ -239,13 +373,32 @@ class RegexBlueprint:
         :return: A string visualization of the blueprint, with patterns and texts formatted in a hierarchical, tree-like structure.
         :rtype: str
         """
-        result = "  " * depth + "RegexBlueprint:\n"
+        parts = []
+        self._tree_parts(parts, depth)
+        return "".join(parts)
+
+    def _tree_parts(self, parts: list[str], depth: int) -> None:
+        """
+        Appends the lines of the tree representation to `parts`, so nested trees are joined only once by the caller.
+
+        :param parts: The list collecting the lines of the tree.
+        :type parts: list[str]
+        :param depth: The indentation depth of the blueprint header.
+        :type depth: int
+        """
+        parts.append("  " * depth + "RegexBlueprint:\n")
+        indent = "  " * (depth + 1)
         for name in self.order:
-            text = self.pattern_texts.get(name, '')
-            pattern = (f"{self.pattern_structure['beginning']}"
-                       f"{text}{self.pattern_structure['ending']}")
-            result += "  " * (depth + 1) + f"{name}: Pattern: {pattern}\n"
-        return result
+            item = self.items.get(name)
+            if item is not None:
+                # The pattern was already assembled when the item was created
+                pattern = item.pattern
+            else:
+                text = self.pattern_texts.get(name, '')
+                pattern = "".join((self.pattern_structure['beginning'],
+                                   self._regex_text(text),
+                                   self.pattern_structure['ending']))
+            parts.append(f"{indent}{name}: Pattern: {pattern}\n")
 
 
 class RegexSettings:
@@ -260,6 +413,8 @@ class RegexSettings:
     :vartype order: list[str]
     """
 
+    __slots__ = ('items', 'order')
+
     items: dict[str, RegexRequest | RegexSettings]
     order: list[str]
 
@@ -276,24 +431,19 @@ class RegexSettings:
         :raises ValueError: If either `items` or `order` is provided without the other, raising a configuration inconsistency.
         """
         if items is None and order is None:
+            self.items = {}
+            self.order = []
             if settings_file is not None:
-                # Load from file
-                self.items = {}
-                self.order = []
+                # Load from file, parse_settings validates the result
                 self.load_settings(settings_file)
-            else:
-                # Empty class
-                self.items = {}
-                self.order = []
         elif items is not None and order is not None:
             self.items = items
             self.order = order
+            self.validate_configuration()
         else:
             raise ValueError(
                 "Both 'items' and 'order' must be provided, or neither.")
 
-        self.validate_configuration()
-
     def add_item(self, name: str, item: RegexRequest | RegexSettings, rewrite: bool = False) -> None:
         """
         Adds a new regex pattern or settings group to the `RegexSettings` instance.
@@ -311,7 +461,34 @@ class RegexSettings:
         self.items[name] = item
         if name not in self.order:
             self.order.append(name)
-        self.validate_configuration()
+        # The rest of the group was validated before, only the new item is checked
+        item.validate_configuration()
+
+    def extend(self, items: Iterable[tuple[str, RegexRequest | RegexSettings | RegexBlueprint]], rewrite: bool = False) -> None:
+        """
+        Adds several items at once, like repeated calls to `add_item`, but validating the new items only once all of them are added.
+
+        :param items: Pairs of unique name and `RegexRequest`, `RegexSettings` or `RegexBlueprint`, added in the given order.
+        :type items: Iterable[tuple[str, RegexRequest | RegexSettings | RegexBlueprint]]
+        :param rewrite: If `True`, existing items with the same names are overwritten. Defaults to `False`.
+        :type rewrite: bool, optional
+        :raises ValueError: If an item with the same name already exists and `rewrite` is `False`. Nothing is added in that case.
+        """
+        items = list(items)
+        if not rewrite:
+            if existing := [name for name, _ in items if name in self.items]:
+                raise ValueError(
+                    f"Item(s) with name(s) '{', '.join(existing)}' already exist.")
+        self.items.update(items)
+        ordered_names = set(self.order)
+        new_names = []
+        for name, _ in items:
+            if name not in ordered_names:
+                new_names.append(name)
+                ordered_names.add(name)
+        self.order.extend(new_names)
+        for _, item in items:
+            item.validate_configuration()
 
     def set_order(self, order: list[str]) -> None:
         """
@@ -321,8 +498,7 @@ class RegexSettings:
         :type order: list[str]
         :raises ValueError: If any name in the provided order does not correspond to an existing item in `self.items`.
         """
-        if any(name not in self.items for name in order):
-            missing_items = [name for name in order if name not in self.items]
+        if missing_items := [name for name in order if name not in self.items]:
             raise ValueError(
                 f"Item(s) '{', '.join(missing_items)}' not found in items.")
         self.order = order
@@ -349,38 +525,83 @@ class RegexSettings:
         :raises TypeError: If an item within `self.items` is neither a `RegexRequest` nor a `RegexSettings` instance.
         """
         ordered_items = []
-        for name in self.order:
-            item = self.items[name]
-            if isinstance(item, RegexRequest):
-                ordered_items.append(item)
-            elif isinstance(item, (RegexSettings, RegexBlueprint)):
-                ordered_items.extend(item.to_list())
+        # Walk nested groups with an explicit stack of (group, remaining names)
+        # so that every request is appended once to the same output list
+        stack = [(self, iter(self.order))]
+        while stack:
+            group, names = stack[-1]
+            for name in names:
+                item = group.items[name]
+                kind = _ITEM_KINDS.get(type(item)) or _item_kind(item)
+                if kind is RegexRequest:
+                    ordered_items.append(item)
+                elif kind is RegexSettings:
+                    # Descend, the rest of this group is resumed afterwards
+                    stack.append((item, iter(item.order)))
+                    break
+                elif kind is RegexBlueprint:
+                    ordered_items.extend(item.to_list())
+                else:
+                    raise TypeError(
+                        f"Unknown type of item '{name}': {type(item)}")
             else:
-                raise TypeError(f"Unknown type of item '{name}': {type(item)}")
+                stack.pop()
         return ordered_items
 
+    def compile_combined(self) -> list[tuple[Pattern, dict[str | None, RegexRequest]]]:
+        """
+        Combines the requests of `to_list` into as few patterns as possible, so a text can be scanned for all of them in a few passes instead of one per request.
+
+        Requests with the same flags are joined into one alternation, each wrapped in a group named `_0`, `_1`, ... in the order of `to_list`. Requests that cannot be part of an alternation, because they use backreferences, named groups or inline global flags, keep a pattern of their own. In every pair, `mapping[match.lastgroup]` gives the request a match belongs to. Within a combined pattern the leftmost match in the text wins, and at the same position the request that comes first in `to_list`; unlike `RegexRequest.apply`, earlier matches do not remove text from the scan of later requests.
+
+        :return: Pairs of compiled pattern and the mapping from group name to request.
+        :rtype: list[tuple[Pattern, dict[str | None, RegexRequest]]]
+        """
+        alternatives: dict[int,
+                           tuple[list[str], dict[str | None, RegexRequest]]] = {}
+        separate = []
+        for index, request in enumerate(self.to_list()):
+            flags = request.flags
+            if _is_self_contained(request.pattern, flags):
+                sources, mapping = alternatives.setdefault(flags, ([], {}))
+                name = f"_{index}"
+                sources.append(_group_source(request.pattern, flags, name))
+                mapping[name] = request
+            else:
+                compiled = request.compile()
+                # A match of a pattern of its own is mapped whichever group it ends with
+                mapping = dict.fromkeys((None, *compiled.groupindex), request)
+                separate.append((compiled, mapping))
+        combined = [(_compile_cached("|".join(sources), flags), mapping)
+                    for flags, (sources, mapping) in alternatives.items()]
+        return combined + separate
+
     def load_settings(self, settings_file: str) -> None:
         """
         Populates the `RegexSettings` instance with configurations from a specified JSON file.
 
+        The file is parsed with `orjson` or `msgspec` when one of them is installed and with the standard `json` module otherwise.
+
         :param settings_file: The file path to the JSON file containing regex configurations.
         :type settings_file: str
         """
-        with open(settings_file, "r") as file:
-            settings = json.load(file)
-            self.parse_settings(settings)
+        with open(settings_file, "rb") as file:
+            settings = _json_loads(file.read())
+        self.parse_settings(settings)
 
-    def parse_settings(self, settings: dict[str, dict | list[str]]) -> None:
+    def parse_settings(self, settings: dict[str, dict | list[str]], validate: bool = True) -> None:
         """
         Parses a settings dictionary to populate the `RegexSettings` instance with `RegexRequest`, `RegexBlueprint`, or nested `RegexSettings`.
 
         :param settings: A dictionary containing the configuration for regex patterns. It may define `RegexRequest` objects directly, specify `RegexBlueprint` configurations, or contain nested `RegexSettings`.
         :type settings: dict[str, dict| list[str]]
+        :param validate: Whether to validate the parsed configuration. Nested groups are parsed with `False`, as the validation of the top-level group covers them.
+        :type validate: bool, optional
         """
-        self.items = {}
-        self.order = settings.get('order', [])
+        items = {}
+        order = settings.get('order', [])
 
-        for name in self.order:
+        for name in order:
             item_settings = settings[name]
 
             # Handling a direct RegexRequest (defined by a 'pattern' key)
@@ -392,7 +613,7 @@ class RegexSettings:
                     flags=item_settings.get('flags', []),
                     comment=item_settings.get('comment', '')
                 )
-                self.items[name] = request
+                items[name] = request
 
             # Handling a RegexBlueprint (defined by a 'pattern_structure' key)
             elif 'pattern_structure' in item_settings:
@@ -402,17 +623,20 @@ class RegexSettings:
                     pattern_texts=item_settings['pattern_texts'],
                     comment=item_settings.get('comment', '')
                 )
-                self.items[name] = blueprint
+                items[name] = blueprint
 
             # Handling nested RegexSettings
             else:
                 # If the item is a nested structure but not a direct RegexRequest or Blueprint
                 subgroup = RegexSettings()
-                subgroup.parse_settings(item_settings)
-                self.items[name] = subgroup
+                subgroup.parse_settings(item_settings, validate=False)
+                items[name] = subgroup
 
-        # Validate the configuration after parsing
-        self.validate_configuration()
+        self.items = items
+        self.order = order
+        # Validate the configuration after parsing, once for the whole tree
+        if validate:
+            self.validate_configuration()
 
     def tree(self, depth: int = 0) -> str:
         """
@@ -423,17 +647,40 @@ class RegexSettings:
         :return: A string visualization of the settings hierarchy, formatted as an indented tree structure.
         :rtype: str
         """
-        result = "  " * depth + "RegexGroup:\n"
-        for name in self.order:
-            item = self.items[name]
-            # If the item is a RegexSettings or RegexBlueprint, recursively call the tree method to represent its nested structure
-            if isinstance(item, (RegexSettings, RegexBlueprint)):
-                result += "  " * (depth + 1) + \
-                    f"{name}:\n" + item.tree(depth + 2)
-            # If the item is a RegexRequest, simply append its string representation
+        parts = []
+        self._tree_parts(parts, depth)
+        return "".join(parts)
+
+    def _tree_parts(self, parts: list[str], depth: int) -> None:
+        """
+        Appends the lines of the tree representation to `parts`, letting nested blueprints write into the same list.
+
+        :param parts: The list collecting the lines of the tree.
+        :type parts: list[str]
+        :param depth: The indentation depth of the group header.
+        :type depth: int
+        """
+        parts.append("  " * depth + "RegexGroup:\n")
+        # Walk nested groups with an explicit stack of (group, remaining names,
+        # item indentation), like `to_list`, instead of recursing into them
+        stack = [(self, iter(self.order), "  " * (depth + 1))]
+        while stack:
+            group, names, indent = stack[-1]
+            for name in names:
+                item = group.items[name]
+                kind = _ITEM_KINDS.get(type(item)) or _item_kind(item)
+                if kind is RegexSettings:
+                    parts.append(f"{indent}{name}:\n{indent}  RegexGroup:\n")
+                    stack.append((item, iter(item.order), indent + "    "))
+                    break
+                elif kind is RegexBlueprint:
+                    parts.append(f"{indent}{name}:\n")
+                    item._tree_parts(parts, len(indent) // 2 + 1)
+                # If the item is a RegexRequest, simply append its string representation
+                else:
+                    parts.append(f"{indent}{name}: {item}\n")
             else:
-                result += "  " * (depth + 1) + f"{name}: {item}\n"
-        return result
+                stack.pop()
 
     def validate_configuration(self) -> None:
         """
@@ -442,15 +689,18 @@ class RegexSettings:
         :raises ValueError: If an ordered item is missing from the items dictionary.
         :raises RuntimeWarning: If there are items not included in the order.
         """
-        # Check for items in 'order' that are not in 'items'
-        for name in self.order:
-            if name not in self.items:
-                raise ValueError(
-                    f"Error: Item '{name}' listed in 'order' but not found in 'items'.")
+        # Check for items in 'order' that are not in 'items', as one set
+        # comparison, looking for the offending name only when it fails
+        items = self.items
+        ordered_names = set(self.order)
+        if not items.keys() >= ordered_names:
+            name = next(name for name in self.order if name not in items)
+            raise ValueError(
+                f"Error: Item '{name}' listed in 'order' but not found in 'items'.")
 
-        for name, item in self.items.items():
+        for name, item in items.items():
             item.validate_configuration()
-            if name not in self.order:
+            if name not in ordered_names:
                 logger.warning(
                     f"Warning: Item '{name}' found in 'items' but not listed in 'order'.")
 
@@ -475,8 +725,9 @@ class RegexSettings:
         :param filename: The file path where the JSON representation of the regex settings should be saved.
         :type filename: str
         """
+        # Encode in one go and write once, `json.dump` writes every token separately
         with open(filename, 'w') as file:
-            json.dump(self.to_dict(), file, indent=4)
+            file.write(json.dumps(self.to_dict(), indent=4))
 
     def __repr__(self) -> str:
         """
@@ -505,6 +756,30 @@ class RegexSettings:
         """
         return self.tree()
 
+
+_ITEM_KINDS = {
+    RegexRequest: RegexRequest,
+    RegexSettings: RegexSettings,
+    RegexBlueprint: RegexBlueprint,
+}
+"""Maps the exact type of a settings item to the class it is handled as, sparing `isinstance` checks for the common case."""
+
+
+def _item_kind(item: object) -> type | None:
+    """
+    Finds the settings class an item is handled as when its exact type is not in `_ITEM_KINDS`, i.e. for subclasses.
+
+    :param item: An item stored in a `RegexSettings`.
+    :type item: object
+    :return: `RegexRequest`, `RegexSettings` or `RegexBlueprint`, or `None` for any other type.
+    :rtype: type | None
+    """
+    for kind in (RegexRequest, RegexSettings, RegexBlueprint):
+        if isinstance(item, kind):
+            return kind
+    return None
+
+
 # Variable Documentation
 
 
@@ -515,10 +790,11 @@ Path to the default ORCA regex settings JSON file, included with the package.
 :type: str
 """
 
-DEFAULT_ORCA_REGEX_SETTINGS = RegexSettings(
-    settings_file=DEFAULT_ORCA_REGEX_FILE)
+# The DEFAULT_*_REGEX_SETTINGS are only declared here so they are documented,
+# the instances are created by the module __getattr__ when first accessed
+DEFAULT_ORCA_REGEX_SETTINGS: RegexSettings
 """
-The pre-loaded `RegexSettings` instance containing the default regex patterns for ORCA output parsing.
+The pre-loaded `RegexSettings` instance containing the default regex patterns for ORCA output parsing, loaded from `DEFAULT_ORCA_REGEX_FILE` on first access.
 :type: RegexSettings
 """
 
@@ -529,10 +805,9 @@ Path to the default GPAW regex settings JSON file, included with the package.
 :type: str
 """
 
-DEFAULT_GPAW_REGEX_SETTINGS = RegexSettings(
-    settings_file=DEFAULT_GPAW_REGEX_FILE)
+DEFAULT_GPAW_REGEX_SETTINGS: RegexSettings
 """
-The pre-loaded `RegexSettings` instance containing the default regex patterns for GPAW output parsing.
+The pre-loaded `RegexSettings` instance containing the default regex patterns for GPAW output parsing, loaded from `DEFAULT_GPAW_REGEX_FILE` on first access.
 :type: RegexSettings
 """
 
@@ -543,9 +818,60 @@ Path to the default VASP regex settings JSON file, included with the package.
 :type: str
 """
 
-DEFAULT_VASP_REGEX_SETTINGS = RegexSettings(
-    settings_file=DEFAULT_VASP_REGEX_FILE)
+DEFAULT_VASP_REGEX_SETTINGS: RegexSettings
 """
-The pre-loaded `RegexSettings` instance containing the default regex patterns for VASP output parsing.
+The pre-loaded `RegexSettings` instance containing the default regex patterns for VASP output parsing, loaded from `DEFAULT_VASP_REGEX_FILE` on first access.
 :type: RegexSettings
 """
+
+_DEFAULT_REGEX_FILES = {
+    'ORCA': DEFAULT_ORCA_REGEX_FILE,
+    'GPAW': DEFAULT_GPAW_REGEX_FILE,
+    'VASP': DEFAULT_VASP_REGEX_FILE,
+}
+"""Maps each supported mode to the file its default settings are loaded from."""
+
+_DEFAULT_REGEX_SETTINGS_MODES = {
+    f'DEFAULT_{mode}_REGEX_SETTINGS': mode for mode in _DEFAULT_REGEX_FILES}
+"""Maps the names of the lazily loaded default settings to their mode."""
+
+
+@functools.cache
+def get_default_regex_settings(mode: str) -> RegexSettings:
+    """
+    Returns the default regex settings for a mode, loading them from the bundled JSON file on the first call.
+
+    The same `RegexSettings` instance is returned on every later call for the mode, and it is also available as `DEFAULT_<MODE>_REGEX_SETTINGS`.
+
+    :param mode: The program whose output is parsed: 'ORCA', 'GPAW' or 'VASP'.
+    :type mode: str
+    :return: The default `RegexSettings` instance for the mode.
+    :rtype: RegexSettings
+    :raises ValueError: If the mode is not supported.
+    """
+    settings_file = _DEFAULT_REGEX_FILES.get(mode)
+    if settings_file is None:
+        raise ValueError(
+            f"Invalid mode '{mode}'. Must be 'ORCA', 'GPAW' or 'VASP'.")
+    return RegexSettings(settings_file=settings_file)
+
+
+def __getattr__(name: str) -> RegexSettings:
+    """
+    Loads the default regex settings on first access.
+
+    `DEFAULT_ORCA_REGEX_SETTINGS`, `DEFAULT_GPAW_REGEX_SETTINGS` and `DEFAULT_VASP_REGEX_SETTINGS` are the pre-loaded `RegexSettings` instances containing the default regex patterns for ORCA, GPAW and VASP output parsing. Each one is read from its JSON file the first time it is used, through `get_default_regex_settings`, and then kept in the module, so importing the package does not parse the settings of every supported program.
+
+    :param name: The name of the requested module attribute.
+    :type name: str
+    :return: The default `RegexSettings` instance with that name.
+    :rtype: RegexSettings
+    :raises AttributeError: If `name` is not one of the default settings.
+    """
+    mode = _DEFAULT_REGEX_SETTINGS_MODES.get(name)
+    if mode is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+    settings = get_default_regex_settings(mode)
+    globals()[name] = settings
+    return settings
@@ -1,7 +1,43 @@
-from pint import UnitRegistry
+import functools
 
 
-ureg = UnitRegistry()
+@functools.cache
+def get_unit_registry():
+    """
+    Creates the pint unit registry on first use and returns the same registry afterwards.
+
+    Importing pint and building its registry is the slowest part of importing ChemParse, so it is deferred until a unit is actually needed.
+
+    :return: The unit registry shared by all of ChemParse.
+    :rtype: pint.UnitRegistry
+    """
+    from pint import UnitRegistry
+
+    registry = UnitRegistry()
+    registry.define("electron = []")
+    return registry
+
+
+ureg: "pint.UnitRegistry"
 """Unit registry for pint, use this to define units and constants, do not create a new one"""
 
-ureg.define("electron = []")
+
+def __getattr__(name):
+    """
+    Creates `ureg` on first access, so importing this module does not import pint.
+
+    :param name: The name of the requested module attribute.
+    :type name: str
+    :return: The registry of `get_unit_registry` for `ureg`.
+    :rtype: pint.UnitRegistry
+    :raises AttributeError: If `name` is not `ureg`.
+    """
+    if name == 'ureg':
+        # Cached as a real global, so later lookups skip this function
+        globals()[name] = value = get_unit_registry()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {'ureg'})
@@ -9,7 +9,7 @@ import pandas as pd
 from .data import Data
 from .elements import AvailableBlocksGeneral, Block, Element, ExtractionError
 from .logging_config import logger
-from .units_and_constants import ureg
+from .units_and_constants import get_unit_registry
 
 
 class AvailableBlocksVasp(AvailableBlocksGeneral):
@@ -188,6 +188,7 @@ class BlockVaspFreeEnergyOfTheIonElectronSystem(BlockVaspWithSingleLineHeader):
 
         :rtype: Data
         """
+        ureg = get_unit_registry()
         extracted_values = {}
 
         for line in self.raw_data.split("\n"):
@@ -288,6 +289,7 @@ class BlockVaspGeneralTiming(Block):
 
         :rtype: Data
         """
+        ureg = get_unit_registry()
 
         # Define a dictionary to hold the extracted data
         extracted_data = {}
@@ -0,0 +1,43 @@
+import pytest
+
+from chemparse.elements import ExtractionError
+from chemparse.gpaw_elements import BlockGpawOrbitalEnergies
+from chemparse.units_and_constants import ureg
+
+orbital_energies_raw = """                    Up                     Down
+ Band  Eigenvalues  Occupancy  Eigenvalues  Occupancy
+    0    -24.42908    1.00000    -24.57211    1.00000
+    1    -22.16252    1.00000    -22.18228    1.00000
+    2    -21.55401    0.00000    -21.60131    0.00000
+"""
+
+
+def test_orbital_energies_are_numeric():
+    # Verify that the header lines are skipped and the table is parsed into numbers
+    data = BlockGpawOrbitalEnergies(orbital_energies_raw).data()
+    df = data.data['UpDownOrbitals']
+    assert list(df.columns) == ['Band', 'Eigenvalues_Up', 'Occupancy_Up',
+                                'Eigenvalues_Down', 'Occupancy_Down']
+    assert df['Band'].tolist() == [0, 1, 2]
+    assert df['Band'].dtype.kind == 'i'
+    assert df['Eigenvalues_Up'].tolist() == [-24.42908, -22.16252, -21.55401]
+    assert df['Occupancy_Down'].tolist() == [1.0, 1.0, 0.0]
+
+
+def test_orbital_energies_units_are_tagged():
+    # Verify that eigenvalues stay float64 and their unit is reported separately
+    data = BlockGpawOrbitalEnergies(orbital_energies_raw).data().data
+    assert data['UpDownOrbitals']['Eigenvalues_Down'].dtype == 'float64'
+    assert data['Units'] == {'Eigenvalues_Up': ureg.eV,
+                             'Eigenvalues_Down': ureg.eV}
+
+
+@pytest.mark.parametrize('raw_data', [
+    orbital_energies_raw.split('\n', 1)[0],
+    orbital_energies_raw.replace('-22.18228', 'n/a'),
+    orbital_energies_raw.replace('    1.00000\n', '\n', 1),
+])
+def test_orbital_energies_malformed_table(raw_data):
+    # Verify that short tables, non-numeric values and missing columns are reported
+    with pytest.raises(ExtractionError):
+        BlockGpawOrbitalEnergies(raw_data).data()
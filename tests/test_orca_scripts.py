@@ -2,6 +2,7 @@ import os
 
 import pytest
 
+from chemparse.file import File
 from chemparse.scripts import chem_parse, chem_to_html
 
 # Test data directory
@@ -33,3 +34,16 @@ def test_chem_parse_auto(orca_output_file, tmp_path):
         assert (temp_output_file.exists(),
                 f"{file_format.upper()} file was not created")
         # Additional checks for the output file content based on the format can be added here
+
+
+def test_chem_parse_accepts_parsed_file(tmp_path):
+    # Verify that a parsed File can be passed instead of its path, with the same output
+    orca_output_file = orca_output_files[0]
+    parsed = File(orca_output_file)
+    from_path = tmp_path / "from_path.csv"
+    from_file = tmp_path / "from_file.csv"
+    chem_parse(orca_output_file, str(from_path))
+    chem_parse(parsed, str(from_file))
+    chem_to_html(parsed, str(tmp_path / "from_file.html"))
+    assert from_file.read_bytes() == from_path.read_bytes()
+    assert (tmp_path / "from_file.html").exists()
@@ -0,0 +1,189 @@
+import re
+
+import pytest
+
+from chemparse import regex_request
+from chemparse.elements import Block
+from chemparse.regex_request import RegexRequest
+
+
+@pytest.fixture
+def sample_request():
+    return RegexRequest(p_type='Block',
+                        p_subtype='TestBlock',
+                        pattern=r'^(Test start\n(?:.*\n)*?Test end\n)',
+                        flags=['MULTILINE'],
+                        comment='Sample request for testing')
+
+
+def test_regex_request_compile_is_cached(sample_request):
+    # Verify that the compiled pattern is reused between calls
+    compiled = sample_request.compile()
+    assert compiled is sample_request.compile()
+    assert compiled is sample_request.compiled
+    assert sample_request.engine in ('re', 'regex', 're2')
+    assert compiled.flags & re.MULTILINE
+
+
+def test_regex_request_compile_follows_changes(sample_request):
+    # Verify that changing the pattern or the flags invalidates the compiled pattern
+    sample_request.compile()
+    sample_request.pattern = 'other'
+    assert sample_request.compile().pattern == 'other'
+    sample_request.flags = 0
+    assert not sample_request.compile().flags & re.MULTILINE
+
+
+def test_regex_request_apply(sample_request):
+    # Verify that matches become elements and the rest stays text
+    text = 'before\nTest start\nbody\nTest end\nafter\n'
+    marked_text, elements = sample_request.apply(text)
+    assert [segment[2] if isinstance(segment[2], str) else segment[2].raw_data
+            for segment in marked_text] == ['before\n', 'Test start\nbody\nTest end\n', 'after\n']
+    assert len(elements) == 1
+    assert marked_text[1][0] == (7, 31)
+
+
+def test_regex_request_apply_without_match(sample_request):
+    # Verify that text without a possible match is left as a single segment
+    text = 'nothing to see\nhere\n'
+    marked_text, elements = sample_request.apply(text)
+    assert marked_text == [((0, len(text) - 1), (1, 3), text)]
+    assert elements == {}
+
+
+def test_regex_request_apply_keys_are_unique(sample_request):
+    # Verify that elements are keyed by integers that never repeat between calls
+    text = 'Test start\nTest end\nTest start\nTest end\n'
+    _, first = sample_request.apply(text)
+    _, second = sample_request.apply(text)
+    keys = list(first) + list(second)
+    assert all(isinstance(key, int) for key in keys)
+    assert len(set(keys)) == len(keys) == 4
+
+
+def test_regex_request_apply_unknown_subtype_falls_back_to_block(sample_request):
+    # Verify that an unknown subtype still produces plain Block elements
+    marked_text, _ = sample_request.apply('Test start\nTest end\n')
+    assert type(marked_text[0][2]) is Block
+
+
+def test_regex_request_apply_unknown_type(sample_request):
+    # Verify that an unsupported type is rejected
+    sample_request.p_type = 'Unknown'
+    with pytest.raises(ValueError):
+        sample_request.apply('Test start\nTest end\n')
+
+
+def test_regex_request_flags():
+    # Verify that flag names are combined case-insensitively and invalid ones are rejected
+    request = RegexRequest(p_type='Block', p_subtype='TestBlock', pattern='a',
+                           flags=['multiline', 'DOTALL'])
+    assert request.flags == re.MULTILINE | re.DOTALL
+    assert RegexRequest(p_type='Block', p_subtype='TestBlock', pattern='a',
+                        flags=[]).flags == 0
+    with pytest.raises(ValueError, match='Invalid flag: Bogus'):
+        RegexRequest(p_type='Block', p_subtype='TestBlock', pattern='a',
+                     flags=['Bogus'])
+
+
+def test_regex_request_shares_compiled_pattern(sample_request):
+    # Verify that requests with the same pattern and flags reuse one compiled object
+    other = RegexRequest(p_type='Spacer',
+                         p_subtype='Other',
+                         pattern=sample_request.pattern,
+                         flags=['MULTILINE'])
+    assert other.compile() is sample_request.compile()
+
+
+def test_regex_request_non_string_fields():
+    # Verify that a type, subtype or comment that is not a string is kept as given
+    request = RegexRequest(p_type=None, p_subtype=1, pattern='a',
+                           flags=[], comment=None)
+    assert request.p_type is None
+    assert request.p_subtype == 1
+    assert request.comment is None
+
+
+def test_regex_request_invalid_pattern():
+    # Verify that a malformed pattern is reported when the request is created
+    with pytest.raises(ValueError, match='Invalid regex pattern'):
+        RegexRequest(p_type='Block', p_subtype='Broken', pattern='(unclosed',
+                     flags=[])
+
+
+def test_regex_request_match_delegates(sample_request):
+    # Verify that the matching helpers use the compiled pattern
+    text = 'Test start\nTest end\nTest start\nTest end\n'
+    assert sample_request.search(text).start() == 0
+    assert len(list(sample_request.finditer(text))) == 2
+    assert sample_request.sub('', text) == ''
+
+
+@pytest.fixture
+def re2_engine(monkeypatch):
+    # Compile with RE2, as with CHEMPARSE_REGEX_ENGINE=re2, and `re` as fallback
+    re2 = pytest.importorskip('re2')
+    monkeypatch.setattr(regex_request, '_regex_engine', re2)
+    monkeypatch.setattr(regex_request, '_regex_fallback', re)
+    monkeypatch.setattr(regex_request, '_regex_error', re2.error)
+    regex_request._compile_cached.cache_clear()
+    yield re2
+    regex_request._compile_cached.cache_clear()
+
+
+def test_regex_request_re2_pattern_contract(re2_engine, capfd):
+    # Verify that RE2 patterns report their source and flags as `re` does and rejected ones fall back quietly
+    request = RegexRequest(p_type='Block', p_subtype='TestBlock',
+                           pattern=r'^(Test start\n(?:.*\n)*?Test end\n)',
+                           flags=['MULTILINE', 'IGNORECASE'])
+    compiled = request.compile()
+    reference = re.compile(request.pattern, request.flags)
+    assert request.engine == 're2'
+    assert compiled.pattern == reference.pattern
+    assert compiled.flags == reference.flags
+    text = 'test start\nTest END\nother\nTest start\nTest end\n'
+    assert ([match.span() for match in compiled.finditer(text)] ==
+            [match.span() for match in reference.finditer(text)])
+
+    backreference = RegexRequest(p_type='Block', p_subtype='TestBlock',
+                                 pattern=r'(a)\1', flags=[])
+    assert backreference.engine == 're'
+    assert capfd.readouterr().err == ''
+
+
+def test_regex_request_re2_fallback_contract(re2_engine, monkeypatch):
+    # Verify that patterns RE2 rejects, compiled by `regex`, still report the source and flags of `re`
+    regex = pytest.importorskip('regex')
+    monkeypatch.setattr(regex_request, '_regex_fallback', regex)
+    request = RegexRequest(p_type='Block', p_subtype='TestBlock',
+                           pattern=r'^(Test (\w+)\n(?:.*\n)*?\2 end\n)',
+                           flags=['MULTILINE'])
+    compiled = request.compile()
+    reference = re.compile(request.pattern, request.flags)
+    assert request.engine == 'regex'
+    assert compiled.pattern == reference.pattern
+    assert compiled.flags == reference.flags
+    text = 'Test start\nstart end\nTest other\nstart end\nother end\n'
+    assert ([match.span() for match in compiled.finditer(text)] ==
+            [match.span() for match in reference.finditer(text)])
+
+
+def test_regex_request_regex_engine_contract(monkeypatch):
+    # Verify that patterns compiled by `regex` report the source and flags of `re`
+    regex = pytest.importorskip('regex')
+    monkeypatch.setattr(regex_request, '_regex_engine', regex)
+    monkeypatch.setattr(regex_request, '_regex_error', regex.error)
+    regex_request._compile_cached.cache_clear()
+    request = RegexRequest(p_type='Block', p_subtype='TestBlock',
+                           pattern=r'^(Test start\n(?:.*\n)*?Test end\n)',
+                           flags=['MULTILINE', 'DOTALL'])
+    compiled = request.compile()
+    regex_request._compile_cached.cache_clear()
+    reference = re.compile(request.pattern, request.flags)
+    assert request.engine == 'regex'
+    assert compiled.pattern == reference.pattern
+    assert compiled.flags == reference.flags
+    text = 'Test start\nTest end\nother\nTest start\nTest end\n'
+    assert ([match.span() for match in compiled.finditer(text)] ==
+            [match.span() for match in reference.finditer(text)])
@@ -1,3 +1,6 @@
+import copy
+import re
+
 import pytest
 
 from chemparse.regex_settings import (DEFAULT_ORCA_REGEX_FILE, RegexBlueprint,
@@ -127,3 +130,214 @@ def test_regex_blueprint_tree_structure(sample_blueprint):
     assert "RegexBlueprint:" in tree_str
     for name in sample_blueprint.order:
         assert name in tree_str
+
+
+def test_regex_blueprint_items_share_flags(sample_blueprint):
+    # Verify that the items get the blueprint flags and keep them as names when serialized
+    for request in sample_blueprint.to_list():
+        assert request.flags == re.MULTILINE
+        assert request.to_dict()['flags'] == ['MULTILINE']
+
+
+def test_regex_blueprint_invalid_flag(sample_blueprint):
+    # Verify that an unsupported flag in the structure is reported
+    sample_blueprint.pattern_structure['flags'] = ['MULTILINE', 'Bogus']
+    with pytest.raises(ValueError, match="Invalid flag 'Bogus'"):
+        sample_blueprint.validate_configuration()
+
+
+def test_regex_blueprint_invalid_structure():
+    # Verify that a broken shared structure is rejected when the blueprint is created
+    with pytest.raises(ValueError, match="missing the required key: 'flags'"):
+        RegexBlueprint(['TestBlock1'], {'beginning': '^Test ', 'ending': ' end$'},
+                       {'TestBlock1': 'Content'}, 'Broken blueprint')
+
+
+def test_regex_blueprint_add_item(sample_blueprint):
+    # Verify that an added item is built from the shared structure
+    sample_blueprint.add_item('TestBlock3', 'Content for Block3')
+    assert sample_blueprint.order[-1] == 'TestBlock3'
+    assert sample_blueprint.items['TestBlock3'].pattern == '^Test Content for Block3 end$'
+
+
+def test_default_regex_settings_are_loaded_once():
+    # Verify that the default settings are built on first access and then reused
+    import chemparse
+    from chemparse import regex_settings
+    settings = chemparse.DEFAULT_ORCA_REGEX_SETTINGS
+    assert isinstance(settings, RegexSettings)
+    assert regex_settings.DEFAULT_ORCA_REGEX_SETTINGS is settings
+    with pytest.raises(AttributeError):
+        regex_settings.DEFAULT_UNKNOWN_REGEX_SETTINGS
+
+
+def test_regex_settings_length_follows_nested_changes(sample_blueprint):
+    # Verify that the cached length is refreshed when a nested blueprint grows
+    inner = RegexSettings(items={'Blueprint': sample_blueprint},
+                          order=['Blueprint'])
+    outer = RegexSettings(items={'Inner': inner}, order=['Inner'])
+    assert len(outer) == 2
+    sample_blueprint.add_item('TestBlock3', 'Content for Block3')
+    assert len(outer) == 3
+    outer.add_item('Request', RegexRequest('Block', 'Extra', 'extra', []))
+    assert len(outer) == 4
+
+
+def test_regex_settings_length_follows_direct_edits(sample_blueprint):
+    # Verify that editing `items` or a blueprint's `order` directly refreshes the cached length
+    inner = RegexSettings(items={'Blueprint': sample_blueprint},
+                          order=['Blueprint'])
+    outer = RegexSettings(items={'Inner': inner}, order=['Inner'])
+    assert len(outer) == 2
+    outer.items['Request'] = RegexRequest('Block', 'Extra', 'extra', [])
+    assert len(outer) == 3
+    sample_blueprint.order.pop()
+    assert len(outer) == 2
+    del outer.items['Request']
+    assert len(outer) == 1
+
+
+def test_regex_settings_keeps_given_containers(sample_blueprint):
+    # Verify that the items and order passed in are used as they are, not copied
+    items = {'Blueprint': sample_blueprint}
+    order = ['Blueprint']
+    settings = RegexSettings(items=items, order=order)
+    assert settings.items is items and settings.order is order
+
+
+def test_regex_settings_copy_keeps_tracking(sample_blueprint):
+    # Verify that a deep copy tracks changes to its own nested blueprint
+    inner = RegexSettings(items={'Blueprint': sample_blueprint},
+                          order=['Blueprint'])
+    outer = RegexSettings(items={'Inner': inner}, order=['Inner'])
+    copied = copy.deepcopy(outer)
+    assert len(copied) == 2
+    copied.items['Inner'].items['Blueprint'].add_item('TestBlock3', 'Three')
+    assert len(copied) == 3
+    assert len(outer) == 2
+
+
+def test_regex_settings_to_list_follows_changes(sample_blueprint):
+    # Verify that the cached flattened requests are refreshed after changes and not shared with callers
+    inner = RegexSettings(items={'Blueprint': sample_blueprint},
+                          order=['Blueprint'])
+    outer = RegexSettings(items={'Inner': inner}, order=['Inner'])
+    outer.to_list().clear()
+    subtypes = [r.p_subtype for r in outer.to_list()]
+    assert subtypes == ['TestBlock1', 'TestBlock2']
+    sample_blueprint.add_item('TestBlock3', 'Content for Block3')
+    outer.add_item('Request', RegexRequest('Block', 'Extra', 'extra', []))
+    outer.set_order(['Request', 'Inner'])
+    subtypes = [r.p_subtype for r in outer.to_list()]
+    assert subtypes == ['Extra', 'TestBlock1', 'TestBlock2', 'TestBlock3']
+
+
+def test_regex_settings_to_list_follows_direct_edits(sample_blueprint):
+    # Verify that editing `order` or a blueprint's `items` directly refreshes the flattened requests
+    inner = RegexSettings(items={'Blueprint': sample_blueprint},
+                          order=['Blueprint'])
+    outer = RegexSettings(items={'Inner': inner,
+                                 'Request': RegexRequest('Block', 'Extra',
+                                                         'extra', [])},
+                          order=['Inner', 'Request'])
+    assert outer.to_list()[-1].p_subtype == 'Extra'
+    outer.order.reverse()
+    assert outer.to_list()[0].p_subtype == 'Extra'
+    replacement = RegexRequest('Block', 'Replaced', 'replaced', [])
+    sample_blueprint.items['TestBlock1'] = replacement
+    assert outer.to_list()[1] is replacement
+
+
+def test_regex_settings_compile_combined():
+    # Verify that requests are scanned together where possible and every match maps back to its request
+    first = RegexRequest('Block', 'First', 'alpha', ['MULTILINE'])
+    second = RegexRequest('Block', 'Second', r'(b)eta', ['MULTILINE'])
+    backref = RegexRequest('Block', 'Backref', r'(g)amma\1', ['MULTILINE'])
+    settings = RegexSettings(items={'First': first, 'Second': second, 'Backref': backref},
+                             order=['First', 'Second', 'Backref'])
+    combined = settings.compile_combined()
+    assert len(combined) == 2
+    text = 'beta gammag alpha'
+    found = [(mapping[match.lastgroup].p_subtype, match.start())
+             for compiled, mapping in combined for match in compiled.finditer(text)]
+    assert found == [('Second', 0), ('First', 12), ('Backref', 5)]
+
+
+def test_regex_settings_missing_items():
+    # Verify that order entries without an item are reported
+    request = RegexRequest('Block', 'Known', 'known', [])
+    with pytest.raises(ValueError, match="Item 'Missing' listed in 'order'"):
+        RegexSettings(items={'Known': request}, order=['Known', 'Missing'])
+    settings = RegexSettings(items={'Known': request}, order=['Known'])
+    with pytest.raises(ValueError, match="'Missing, Other' not found"):
+        settings.set_order(['Known', 'Missing', 'Other'])
+
+
+def test_regex_blueprint_iter_matches(sample_blueprint):
+    # Verify that one scan finds every item and tells them apart
+    text = 'Test Content for Block2 end\nother\nTest Content for Block1 end\n'
+    assert [(name, match.start()) for name, match in sample_blueprint.iter_matches(text)] == [
+        ('TestBlock2', 0), ('TestBlock1', 34)]
+
+
+def test_regex_blueprint_iter_matches_keeps_group_numbers():
+    # Verify that texts and endings whose group numbers would shift are rejected
+    structure = {'beginning': r'^(-+)\n(', 'ending': r')\n\1$',
+                 'flags': ['MULTILINE']}
+    blueprint = RegexBlueprint(['Note'], dict(structure), {'Note': 'NOTE'}, '')
+    assert [(name, match.group(1)) for name, match
+            in blueprint.iter_matches('--\nNOTE\n--\n')] == [('Note', '--')]
+    grouped = RegexBlueprint(['Note'], dict(structure), {'Note': '(NOTE)'}, '')
+    with pytest.raises(ValueError, match='groups or backreferences'):
+        next(grouped.iter_matches('--\nNOTE\n--\n'))
+    own_group = RegexBlueprint(['Note'], dict(structure, ending=r')\n(-+)\3$'),
+                               {'Note': 'NOTE'}, '')
+    with pytest.raises(ValueError, match='refers to its own groups'):
+        next(own_group.iter_matches('--\nNOTE\n--\n'))
+
+
+def test_regex_blueprint_escape_texts():
+    # Verify that pattern texts are only taken literally when requested
+    structure = {'beginning': '^(', 'ending': ')$', 'flags': ['MULTILINE']}
+    raw = RegexBlueprint(['Energy'], dict(structure), {'Energy': 'E (eV)'}, '')
+    escaped = RegexBlueprint(['Energy'], dict(structure, escape_texts=True),
+                             {'Energy': 'E (eV)'}, '')
+    assert not raw.items['Energy'].compile().search('E (eV)')
+    assert escaped.items['Energy'].compile().search('E (eV)')
+
+
+def test_get_default_regex_settings():
+    # Verify that the default settings are shared with the module attributes and bad modes are rejected
+    from chemparse import regex_settings
+    settings = regex_settings.get_default_regex_settings('GPAW')
+    assert settings is regex_settings.DEFAULT_GPAW_REGEX_SETTINGS
+    with pytest.raises(ValueError):
+        regex_settings.get_default_regex_settings('NWCHEM')
+
+
+def test_star_import_exports_default_settings():
+    # Verify that a star import of the package still gives the default settings and submodules
+    namespace = {}
+    exec('from chemparse import *', namespace)
+    assert {'DEFAULT_ORCA_REGEX_SETTINGS', 'DEFAULT_VASP_REGEX_SETTINGS',
+            'RegexSettings', 'regex_settings', 'file'} <= namespace.keys()
+
+
+def test_regex_blueprint_extend(sample_blueprint):
+    # Verify that several items can be added to a blueprint at once
+    sample_blueprint.extend([('TestBlock3', 'Three'), ('TestBlock4', 'Four')])
+    assert sample_blueprint.order[-2:] == ['TestBlock3', 'TestBlock4']
+    assert sample_blueprint.items['TestBlock4'].pattern == '^Test Four end$'
+
+
+def test_regex_settings_extend(sample_blueprint):
+    # Verify that several items are added at once and duplicates are rejected up front
+    settings = RegexSettings()
+    settings.extend([('Blueprint', sample_blueprint),
+                     ('Request', RegexRequest('Block', 'Extra', 'extra', []))])
+    assert settings.order == ['Blueprint', 'Request']
+    assert len(settings) == 3
+    with pytest.raises(ValueError):
+        settings.extend([('New', RegexRequest('Block', 'New', 'new', [])),
+                         ('Request', RegexRequest('Block', 'Extra', 'extra', []))])
+    assert 'New' not in settings.items
@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+import pint
+
+from chemparse import units_and_constants
+from chemparse.units_and_constants import get_unit_registry
+
+
+def test_ureg_is_the_shared_registry():
+    # Verify that ureg is a real registry, so indexing, membership and isinstance work
+    ureg = units_and_constants.ureg
+    assert isinstance(ureg, pint.UnitRegistry)
+    assert ureg is get_unit_registry()
+    assert ureg['eV'] == 1 * ureg.eV
+    assert 'electron' in ureg
+    assert 'ureg' in dir(units_and_constants)
+
+
+def test_import_does_not_load_pint():
+    # Verify that pint is only imported once ureg is first used
+    code = ("import sys, chemparse.units_and_constants as u; "
+            "assert 'pint' not in sys.modules; u.ureg; "
+            "assert 'pint' in sys.modules")
+    subprocess.run([sys.executable, '-c', code], check=True)